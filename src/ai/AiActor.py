@@ -0,0 +1,77 @@
+import typing
+from threading import Thread
+
+from ai.AlphaBetaPlayer import AlphaBetaPlayer
+from dog.start_status import StartStatus
+from engine import BitBoard
+from engine.BitBoard import BitState
+from enums.Difficulty import Difficulty
+from models.Move import Move
+
+# Avoids circular imports
+if typing.TYPE_CHECKING:
+    from views.Board import Board
+
+
+class AiActor:
+    """Local computer opponent with the same interface as `DogActor`.
+
+    Moves are computed on a background thread and delivered through the
+    player's `receive_move`, just like moves polled from the Dog server.
+    """
+
+    AI_PLAYER_ID = "0"
+
+    __player: AlphaBetaPlayer
+    __board: "Board"
+
+    def __init__(self, difficulty: Difficulty, board: "Board"):
+        super().__init__()
+        self.__player = AlphaBetaPlayer.from_difficulty(difficulty)
+        self.__board = board
+        self.difficulty = difficulty
+        self.player_actor = None
+        self.player_name = ""
+        self.player_id = ""
+
+    def initialize(self, player_name, a_player_actor):
+        self.player_actor = a_player_actor
+        self.player_name = player_name
+        self.player_id = "1"
+        return "Partida local contra o computador"
+
+    def start_match(self, number_of_players, local_player_order="2"):
+        ai_player_order = "1" if local_player_order == "2" else "2"
+        players = [
+            [self.player_name, self.player_id, local_player_order],
+            [
+                f"Computador ({self.difficulty.value})",
+                self.AI_PLAYER_ID,
+                ai_player_order,
+            ],
+        ]
+        return StartStatus("2", "Partida iniciada", players, self.player_id)
+
+    def start(self):
+        """Play the first move when the computer plays the Hounds."""
+        if not self.__board.is_local_player_turn():
+            self.__play(self.__board.engine.state)
+
+    def send_move(self, move: Move):
+        if move.match_status == "next":
+            self.__play(self.__board.engine.state)
+
+    def __play(self, state: BitState):
+        Thread(target=self.__think, args=(state,), daemon=True).start()
+
+    def __think(self, state: BitState):
+        move = self.__player.choose_move(state)
+
+        # Hounds blocked by each other can not move
+        if not move:
+            return
+
+        next_state = BitBoard.apply_move(state, *move)
+        winner = BitBoard.evaluate_winner(next_state)
+
+        self.player_actor.receive_move(Move(*move, next_state.move_counter, winner))
@@ -0,0 +1,242 @@
+import time
+
+from ai.TranspositionTable import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+    update_hash,
+    zobrist_hash,
+)
+from engine import BitBoard
+from engine.BitBoard import BitState
+from enums.Difficulty import Difficulty
+
+WIN_SCORE = 100_000
+MATE_THRESHOLD = WIN_SCORE - 1_000
+"""Scores above this are forced wins, closer to `WIN_SCORE` means faster"""
+
+# Maximum depth and time budget per move in seconds
+DIFFICULTY_SETTINGS = {
+    Difficulty.EASY: (2, 0.1),
+    Difficulty.MEDIUM: (6, 0.5),
+    Difficulty.HARD: (BitBoard.MAX_MOVES + 1, 2.0),
+}
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+def evaluate(state: BitState):
+    """Heuristic score of a non final state for the side to move."""
+    hare = state.hare
+    hounds_behind = len(BitBoard.MASK_NODES[state.hounds & BitBoard.LEFT_MASKS[hare]])
+    hare_mobility = len(
+        BitBoard.MASK_NODES[BitBoard.HARE_MOVE_MASKS[hare] & ~state.occupied]
+    )
+    hounds_advance = sum(
+        BitBoard.COLUMNS[node] for node in BitBoard.MASK_NODES[state.hounds]
+    )
+
+    # Hounds want to stay on the left of the Hare while cornering it before
+    # the move limit
+    score = (
+        40 * hounds_behind
+        - 25 * hare_mobility
+        + 5 * hounds_advance
+        - 2 * state.move_counter
+    )
+
+    return score if state.hounds_to_move else -score
+
+
+class AlphaBetaPlayer:
+    """Negamax alpha-beta search with iterative deepening.
+
+    Moves are ordered by the transposition table move first and then by
+    history heuristic. The search stops at the deepest iteration completed
+    within the time budget.
+    """
+
+    __max_depth: int
+    __time_budget: float
+    __table: TranspositionTable
+    __history: dict[tuple[int, int], int]
+
+    __deadline = 0.0
+    __nodes = 0
+    __depth = 0
+
+    def __init__(
+        self,
+        max_depth: int = BitBoard.MAX_MOVES + 1,
+        time_budget: float = 1.0,
+        table_size_bits: int = 18,
+    ):
+        self.__max_depth = max_depth
+        self.__time_budget = time_budget
+        self.__table = TranspositionTable(table_size_bits)
+        self.__history = {}
+
+    @classmethod
+    def from_difficulty(cls, difficulty: Difficulty):
+        max_depth, time_budget = DIFFICULTY_SETTINGS[difficulty]
+        return cls(max_depth, time_budget)
+
+    @property
+    def nodes(self):
+        """Nodes visited by the last search"""
+        return self.__nodes
+
+    @property
+    def depth(self):
+        """Depth of the last completed iteration"""
+        return self.__depth
+
+    def choose_move(self, state: BitState):
+        """Best `(from_index, to_index)` move found for the side to move."""
+        moves = list(BitBoard.legal_moves(state))
+        if len(moves) <= 1:
+            return moves[0] if moves else None
+
+        self.__table.new_search()
+        self.__history.clear()
+        self.__deadline = time.perf_counter() + self.__time_budget
+        self.__nodes = 0
+        self.__depth = 0
+
+        key = zobrist_hash(state)
+        best_move = moves[0]
+
+        # No need to search past the move limit
+        max_depth = min(self.__max_depth, BitBoard.MAX_MOVES + 1 - state.move_counter)
+
+        for depth in range(1, max_depth + 1):
+            try:
+                score = self.__negamax(state, key, depth, -WIN_SCORE, WIN_SCORE, 0)
+            except _SearchTimeout:
+                break
+
+            entry = self.__table.probe(key)
+            if entry and entry.move:
+                best_move = entry.move
+            self.__depth = depth
+
+            if abs(score) >= MATE_THRESHOLD:
+                break
+
+        return best_move
+
+    def __negamax(
+        self,
+        state: BitState,
+        key: int,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+    ):
+        self.__nodes += 1
+        if self.__nodes & 1023 == 0 and time.perf_counter() > self.__deadline:
+            raise _SearchTimeout()
+
+        original_alpha = alpha
+        table_move = None
+        entry = self.__table.probe(key)
+
+        if entry:
+            table_move = entry.move
+
+            if entry.depth >= depth:
+                score = self.__from_table_score(entry.score, ply)
+
+                if entry.bound == EXACT:
+                    return score
+                if entry.bound == LOWER_BOUND:
+                    alpha = max(alpha, score)
+                elif entry.bound == UPPER_BOUND:
+                    beta = min(beta, score)
+
+                if alpha >= beta:
+                    return score
+
+        moves = self.__order_moves(state, table_move)
+
+        # A side without legal moves loses
+        if not moves:
+            return -(WIN_SCORE - ply)
+
+        mover = state.turn
+        best_score = -WIN_SCORE
+        best_move = moves[0]
+
+        for move in moves:
+            child = BitBoard.apply_move(state, *move)
+            winner = BitBoard.evaluate_winner(child)
+
+            if winner:
+                score = WIN_SCORE - ply - 1
+                if winner != mover:
+                    score = -score
+            elif depth == 1:
+                score = -evaluate(child)
+            else:
+                child_key = update_hash(key, state, *move)
+                score = -self.__negamax(
+                    child, child_key, depth - 1, -beta, -alpha, ply + 1
+                )
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+
+            if score > alpha:
+                alpha = score
+
+            if alpha >= beta:
+                self.__history[move] = self.__history.get(move, 0) + depth * depth
+                break
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+
+        self.__table.store(
+            key, depth, self.__to_table_score(best_score, ply), bound, best_move
+        )
+
+        return best_score
+
+    def __order_moves(self, state: BitState, table_move: tuple[int, int] | None):
+        moves = sorted(
+            BitBoard.legal_moves(state),
+            key=lambda move: self.__history.get(move, 0),
+            reverse=True,
+        )
+
+        if table_move in moves:
+            moves.remove(table_move)
+            moves.insert(0, table_move)
+
+        return moves
+
+    @staticmethod
+    def __to_table_score(score: int, ply: int):
+        # Store forced wins relative to the stored node, not to the root
+        if score >= MATE_THRESHOLD:
+            return score + ply
+        if score <= -MATE_THRESHOLD:
+            return score - ply
+        return score
+
+    @staticmethod
+    def __from_table_score(score: int, ply: int):
+        if score >= MATE_THRESHOLD:
+            return score - ply
+        if score <= -MATE_THRESHOLD:
+            return score + ply
+        return score
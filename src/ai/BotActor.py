@@ -0,0 +1,110 @@
+import logging
+import queue
+import typing
+from concurrent.futures import Executor
+
+from ai.AlphaBetaPlayer import AlphaBetaPlayer
+from engine.GameEngine import GameEngine
+from enums.Animal import Animal
+from enums.Difficulty import Difficulty
+from models.Move import Move
+
+# Avoids circular imports
+if typing.TYPE_CHECKING:
+    from dog.match_manager import ManagedMatch
+
+
+class BotActor:
+    """Computer player of a match hosted by a `MatchManager`.
+
+    Every bot keeps its own headless `GameEngine`, so a single process can
+    play many matches at once. Searches run on their own executor, so they
+    never hold up polling and move delivery. Players are pooled by
+    difficulty: a search borrows an idle one, keeping its transposition
+    table warm, and only concurrent searches create new players.
+    """
+
+    __players: dict[Difficulty, queue.SimpleQueue] = {
+        difficulty: queue.SimpleQueue() for difficulty in Difficulty
+    }
+
+    __engine: GameEngine
+    __difficulty: Difficulty
+    __searches: Executor
+    __animal: Animal | None = None
+
+    def __init__(self, difficulty: Difficulty, searches: Executor):
+        self.__engine = GameEngine()
+        self.__difficulty = difficulty
+        self.__searches = searches
+        self.match: "ManagedMatch | None" = None
+
+    @property
+    def engine(self):
+        return self.__engine
+
+    def receive_start(self, start_status):
+        self.__engine.reset()
+
+        # The local player comes first in the players list, order "1" starts
+        local_player_order = start_status.get_players()[0][2]
+        self.__animal = Animal.HOUND if local_player_order == "1" else Animal.HARE
+
+        if self.__engine.turn == self.__animal:
+            self.__play()
+
+    def receive_move(self, move: Move):
+        if not self.__engine.is_valid_next_move(
+            move.from_index, move.to_index, move.number
+        ):
+            logging.warning("Bot ignoring illegal move %s", move.to_dict())
+            return
+
+        positions = self.__engine.positions
+        self.__engine.move(positions[move.from_index], positions[move.to_index])
+
+        if not self.__engine.is_finished():
+            self.__play()
+
+    def receive_withdrawal_notification(self):
+        self.__animal = None
+
+    def receive_move_failure(self, move: Move):
+        logging.warning("Bot move %d was lost, the match can not go on", move.number)
+        self.__animal = None
+
+    def __play(self):
+        future = self.__searches.submit(self.__search, self.__engine.state)
+        future.add_done_callback(self.__searched)
+
+    def __search(self, state):
+        players = BotActor.__players[self.__difficulty]
+        try:
+            player = players.get_nowait()
+        except queue.Empty:
+            player = AlphaBetaPlayer.from_difficulty(self.__difficulty)
+
+        try:
+            return state, player.choose_move(state)
+        finally:
+            players.put(player)
+
+    def __searched(self, future):
+        try:
+            state, move = future.result()
+        except Exception:
+            logging.exception("Bot search failed")
+            return
+
+        # Hounds blocked by each other can not move, and a new match may
+        # have started during the search
+        if not move or state != self.__engine.state:
+            return
+
+        from_index, to_index = move
+        positions = self.__engine.positions
+        winner = self.__engine.move(positions[from_index], positions[to_index])
+
+        self.match.send_move(
+            Move(from_index, to_index, self.__engine.move_counter, winner)
+        )
@@ -0,0 +1,213 @@
+import logging
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ai.AlphaBetaPlayer import evaluate
+from engine import BitBoard
+from engine.BitBoard import BitState
+from enums.Animal import Animal
+
+RANDOM_PLAYOUT = "random"
+HEURISTIC_PLAYOUT = "heuristic"
+
+
+def _stalemate_winner(state: BitState):
+    # A side without legal moves loses
+    return Animal.HARE if state.hounds_to_move else Animal.HOUND
+
+
+class _Node:
+    __slots__ = (
+        "state",
+        "parent",
+        "move",
+        "children",
+        "untried_moves",
+        "visits",
+        "reward",
+        "winner",
+    )
+
+    def __init__(self, state: BitState, parent=None, move=None):
+        self.state = state
+        self.parent = parent
+        self.move = move
+        self.children = []
+        self.untried_moves = list(BitBoard.legal_moves(state))
+        self.visits = 0
+        # Reward for the side that played `move`
+        self.reward = 0.0
+        self.winner = BitBoard.evaluate_winner(state) if move else None
+
+
+def _playout(state: BitState, policy: str, rng: random.Random):
+    """Play until the end of the match and return the winner."""
+    while True:
+        moves = list(BitBoard.legal_moves(state))
+
+        if not moves:
+            return _stalemate_winner(state)
+
+        if policy == HEURISTIC_PLAYOUT and rng.random() < 0.8:
+            children = [BitBoard.apply_move(state, *move) for move in moves]
+            child = min(children, key=evaluate)
+        else:
+            child = BitBoard.apply_move(state, *rng.choice(moves))
+
+        winner = BitBoard.evaluate_winner(child)
+        if winner:
+            return winner
+
+        state = child
+
+
+def _search(
+    state: BitState,
+    time_budget: float,
+    exploration: float,
+    policy: str,
+    seed: int,
+):
+    """UCT search from `state`, returning root children stats and playouts.
+
+    Runs in the worker processes, so it only takes and returns picklable
+    values.
+    """
+    rng = random.Random(seed)
+    root = _Node(state)
+    deadline = time.perf_counter() + time_budget
+    playouts = 0
+
+    while time.perf_counter() < deadline:
+        node = root
+
+        # Selection
+        while not node.untried_moves and node.children and node.winner is None:
+            log_visits = math.log(node.visits)
+            node = max(
+                node.children,
+                key=lambda child: child.reward / child.visits
+                + exploration * math.sqrt(log_visits / child.visits),
+            )
+
+        # Expansion
+        if node.untried_moves and node.winner is None:
+            move = node.untried_moves.pop(rng.randrange(len(node.untried_moves)))
+            child = _Node(BitBoard.apply_move(node.state, *move), node, move)
+            node.children.append(child)
+            node = child
+
+        # Simulation
+        if node.winner:
+            winner = node.winner
+        elif not node.untried_moves and not node.children:
+            winner = _stalemate_winner(node.state)
+        else:
+            winner = _playout(node.state, policy, rng)
+
+        # Backpropagation
+        while node.parent:
+            node.visits += 1
+            if node.parent.state.turn == winner:
+                node.reward += 1
+            node = node.parent
+
+        root.visits += 1
+        playouts += 1
+
+    stats = {child.move: (child.visits, child.reward) for child in root.children}
+    return stats, playouts
+
+
+class MctsPlayer:
+    """Monte Carlo tree search with root parallelization.
+
+    Every worker process grows its own UCT tree from the current state for
+    the whole time budget, then the root statistics are merged and the most
+    visited move is played. Move latency only depends on the time budget.
+    """
+
+    __time_budget: float
+    __workers: int
+    __exploration: float
+    __policy: str
+    __executor: ProcessPoolExecutor | None = None
+    __playouts = 0
+    __playouts_per_second = 0.0
+
+    def __init__(
+        self,
+        time_budget: float = 1.0,
+        workers: int | None = None,
+        exploration: float = math.sqrt(2),
+        policy: str = RANDOM_PLAYOUT,
+    ):
+        self.__time_budget = time_budget
+        self.__workers = workers or os.cpu_count() or 1
+        self.__exploration = exploration
+        self.__policy = policy
+
+    @property
+    def playouts(self):
+        """Playouts of the last search, across all workers"""
+        return self.__playouts
+
+    @property
+    def playouts_per_second(self):
+        return self.__playouts_per_second
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        if self.__executor:
+            self.__executor.shutdown(cancel_futures=True)
+            self.__executor = None
+
+    def choose_move(self, state: BitState):
+        """Most visited `(from_index, to_index)` move for the side to move."""
+        moves = list(BitBoard.legal_moves(state))
+        if len(moves) <= 1:
+            return moves[0] if moves else None
+
+        start = time.perf_counter()
+        results = self.__run_searches(state)
+        elapsed = time.perf_counter() - start
+
+        visits = {move: 0 for move in moves}
+        self.__playouts = 0
+
+        for stats, playouts in results:
+            self.__playouts += playouts
+            for move, (move_visits, _) in stats.items():
+                visits[move] += move_visits
+
+        self.__playouts_per_second = self.__playouts / elapsed
+        logging.debug(
+            "MCTS: %d playouts in %.2fs (%.0f playouts/s, %d workers)",
+            self.__playouts,
+            elapsed,
+            self.__playouts_per_second,
+            self.__workers,
+        )
+
+        return max(visits, key=visits.get)
+
+    def __run_searches(self, state: BitState):
+        seeds = [random.getrandbits(32) for _ in range(self.__workers)]
+        args = (state, self.__time_budget, self.__exploration, self.__policy)
+
+        if self.__workers == 1:
+            return [_search(*args, seeds[0])]
+
+        if not self.__executor:
+            self.__executor = ProcessPoolExecutor(self.__workers)
+
+        futures = [self.__executor.submit(_search, *args, seed) for seed in seeds]
+        return [future.result() for future in futures]
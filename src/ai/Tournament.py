@@ -0,0 +1,182 @@
+"""Headless self-play between two agents.
+
+Agents are described by specs, so they can be created inside worker
+processes:
+
+- `random`: plays a random legal move
+- `alphabeta[:easy|medium|hard]`: `AlphaBetaPlayer`, medium by default
+- `mcts[:seconds]`: single process `MctsPlayer`, 0.1s per move by default
+- `tablebase`: perfect play read from the tablebase
+"""
+
+import json
+import logging
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from ai.AlphaBetaPlayer import AlphaBetaPlayer
+from ai.MctsPlayer import MctsPlayer
+from engine import BitBoard
+from engine.BitBoard import BitState
+from engine.TablebaseReader import TablebaseReader
+from enums.Animal import Animal
+from enums.Difficulty import Difficulty
+
+
+class RandomPlayer:
+    __random: random.Random
+
+    def __init__(self, seed: int | None = None):
+        self.__random = random.Random(seed)
+
+    def choose_move(self, state: BitState):
+        moves = list(BitBoard.legal_moves(state))
+        return self.__random.choice(moves) if moves else None
+
+
+class TablebasePlayer:
+    __reader: TablebaseReader
+
+    def __init__(self):
+        self.__reader = TablebaseReader()
+
+    def choose_move(self, state: BitState):
+        entry = self.__reader.lookup(state)
+        return entry.move if entry else None
+
+
+def create_player(spec: str):
+    name, _, argument = spec.partition(":")
+
+    if name == "random":
+        return RandomPlayer()
+
+    if name == "alphabeta":
+        difficulty = Difficulty[argument.upper()] if argument else Difficulty.MEDIUM
+        return AlphaBetaPlayer.from_difficulty(difficulty)
+
+    if name == "mcts":
+        return MctsPlayer(float(argument) if argument else 0.1, workers=1)
+
+    if name == "tablebase":
+        return TablebasePlayer()
+
+    raise ValueError(f"Unknown agent: {spec}")
+
+
+_players = {}
+"""Players of the current worker process, by spec"""
+
+
+def _get_player(spec: str):
+    if spec not in _players:
+        _players[spec] = create_player(spec)
+
+    return _players[spec]
+
+
+def play_game(game: int, hounds_spec: str, hare_spec: str):
+    players = {
+        Animal.HOUND: _get_player(hounds_spec),
+        Animal.HARE: _get_player(hare_spec),
+    }
+    state = BitBoard.INITIAL_STATE
+    winner = None
+    start = time.perf_counter()
+
+    while not winner:
+        move = players[state.turn].choose_move(state)
+
+        # A side without legal moves loses
+        if not move:
+            winner = Animal.HARE if state.hounds_to_move else Animal.HOUND
+            break
+
+        state = BitBoard.apply_move(state, *move)
+        winner = BitBoard.evaluate_winner(state)
+
+    return {
+        "game": game,
+        "winner": winner.value,
+        "moves": state.move_counter,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+class TournamentSummary:
+    """Aggregates game results without keeping them in memory."""
+
+    __games = 0
+    __moves = 0
+    __wins: dict[str, int]
+    __elapsed = 0.0
+
+    def __init__(self):
+        self.__wins = {animal.value: 0 for animal in Animal}
+
+    def add(self, result: dict):
+        self.__games += 1
+        self.__moves += result["moves"]
+        self.__wins[result["winner"]] += 1
+
+    def finish(self, elapsed: float):
+        self.__elapsed = elapsed
+
+    def as_dict(self):
+        games = self.__games or 1
+        return {
+            "games": self.__games,
+            "win_rate": {animal: wins / games for animal, wins in self.__wins.items()},
+            "average_moves": self.__moves / games,
+            "move_limit": BitBoard.MAX_MOVES,
+            "moves_per_second": self.__moves / self.__elapsed if self.__elapsed else 0,
+            "seconds": self.__elapsed,
+        }
+
+
+def run_tournament(
+    hounds_spec: str,
+    hare_spec: str,
+    games: int,
+    output_path: str,
+    workers: int | None = None,
+):
+    """Play `games` games and stream one JSON line per game to `output_path`.
+
+    The summary is appended as the last line and returned.
+    """
+    summary = TournamentSummary()
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    # Fail fast on invalid specs instead of in every worker
+    create_player(hounds_spec)
+    create_player(hare_spec)
+
+    with open(output_path, "w") as output, ProcessPoolExecutor(workers) as executor:
+        max_pending = workers * 4
+        pending = set()
+        next_game = 0
+
+        while next_game < games or pending:
+            # Keep a bounded number of games in flight
+            while next_game < games and len(pending) < max_pending:
+                pending.add(
+                    executor.submit(play_game, next_game, hounds_spec, hare_spec)
+                )
+                next_game += 1
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                result = future.result()
+                summary.add(result)
+                output.write(json.dumps(result) + "\n")
+
+        summary.finish(time.perf_counter() - start)
+        output.write(json.dumps({"summary": summary.as_dict()}) + "\n")
+
+    logging.info("Tournament finished: %s", summary.as_dict())
+    return summary.as_dict()
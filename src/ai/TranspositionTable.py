@@ -0,0 +1,102 @@
+import random
+from typing import NamedTuple
+
+from engine import BitBoard
+from engine.BitBoard import BitState
+
+_random = random.Random(0x4A5E)
+
+HOUND_KEYS = [_random.getrandbits(64) for _ in range(BitBoard.NODE_COUNT)]
+HARE_KEYS = [_random.getrandbits(64) for _ in range(BitBoard.NODE_COUNT)]
+SIDE_KEY = _random.getrandbits(64)
+COUNTER_KEYS = [_random.getrandbits(64) for _ in range(BitBoard.MAX_MOVES + 2)]
+"""Zobrist keys, the move counter is hashed because of the move limit"""
+
+
+def zobrist_hash(state: BitState):
+    key = HARE_KEYS[state.hare] ^ COUNTER_KEYS[state.move_counter]
+
+    for node in BitBoard.MASK_NODES[state.hounds]:
+        key ^= HOUND_KEYS[node]
+
+    if state.hounds_to_move:
+        key ^= SIDE_KEY
+
+    return key
+
+
+def update_hash(key: int, state: BitState, from_index: int, to_index: int):
+    """Hash of the state reached by playing a move from `state`."""
+    piece_keys = HOUND_KEYS if state.hounds_to_move else HARE_KEYS
+
+    return (
+        key
+        ^ piece_keys[from_index]
+        ^ piece_keys[to_index]
+        ^ SIDE_KEY
+        ^ COUNTER_KEYS[state.move_counter]
+        ^ COUNTER_KEYS[state.move_counter + 1]
+    )
+
+
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+
+class TableEntry(NamedTuple):
+    key: int
+    depth: int
+    score: int
+    bound: int
+    move: tuple[int, int] | None
+    generation: int
+
+
+class TranspositionTable:
+    """Fixed size hash table of search results.
+
+    An entry is replaced when it comes from a previous search or when the new
+    result was searched at least as deep, so the table never grows past its
+    size.
+    """
+
+    __entries: list[TableEntry | None]
+    __mask: int
+    __generation = 0
+
+    def __init__(self, size_bits: int = 18):
+        self.__entries = [None] * (1 << size_bits)
+        self.__mask = (1 << size_bits) - 1
+
+    def new_search(self):
+        self.__generation += 1
+
+    def probe(self, key: int):
+        entry = self.__entries[key & self.__mask]
+
+        if entry and entry.key == key:
+            return entry
+
+        return None
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        score: int,
+        bound: int,
+        move: tuple[int, int] | None,
+    ):
+        index = key & self.__mask
+        entry = self.__entries[index]
+
+        if (
+            entry
+            and entry.generation == self.__generation
+            and entry.depth > depth
+            and entry.key != key
+        ):
+            return
+
+        self.__entries[index] = TableEntry(
+            key, depth, score, bound, move, self.__generation
+        )
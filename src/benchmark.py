@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from dog.move_decoder import decode_move
+
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+if sys.argv[2] == "eager":
+    import PIL.ImageTk, requests
+import views.PlayerInterface
+from views.ImageCache import ImageCache
+imported = time.perf_counter()
+cache = ImageCache(sys.argv[1])
+for path in ("src/images/hare.png", "src/images/hound.png"):
+    cache.sprite(path, 128)
+loaded = time.perf_counter()
+print(json.dumps({"imports": imported - start, "sprites": loaded - imported}))
+"""
+"""Imports the client and prepares its sprites, timed in a fresh interpreter"""
+
+
+def benchmark_decoding(repeat=20000):
+    """Time decoding a polled `match/` response, with `eval` and without."""
+    move = {
+        "move": [3, 4, 12],
+        "winner": None,
+        "match_status": "next",
+        "player": "152438867993",
+        "order": "12",
+    }
+    responses = {
+        "python literal": json.dumps({"0": "12", "1": repr(move)}),
+        "json": json.dumps({"0": "12", "1": json.dumps(move)}),
+    }
+    decoders = [
+        ("eval", "python literal", lambda text: eval(text)),
+        ("decode_move", "python literal", decode_move),
+        ("decode_move", "json", decode_move),
+    ]
+    for decoder, payload, decode in decoders:
+        response = responses[payload]
+        seconds = timeit.timeit(
+            lambda: decode(json.loads(response)["1"]), number=repeat
+        )
+        logging.info(
+            "%s on %s payload: %.1f µs per poll",
+            decoder,
+            payload,
+            seconds / repeat * 1e6,
+        )
+
+
+def benchmark_startup(repeat=10):
+    """Time the client startup, with the previous eager imports and without.
+
+    Sprites are prepared with an empty cache, as on the first launch, and
+    with a warm one, as on every later launch.
+    """
+    env = dict(os.environ, PYTHONPATH="src")
+
+    def run(cache_dir, imports):
+        output = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT, cache_dir, imports],
+            env=env,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        return json.loads(output)
+
+    with tempfile.TemporaryDirectory() as warm_cache_dir:
+        run(warm_cache_dir, "lazy")
+
+        for imports, cache in [
+            ("eager", "warm"),
+            ("lazy", "cold"),
+            ("lazy", "warm"),
+        ]:
+            timings = []
+            for _ in range(repeat):
+                if cache == "warm":
+                    timings.append(run(warm_cache_dir, imports))
+                    continue
+                with tempfile.TemporaryDirectory() as cold_cache_dir:
+                    timings.append(run(cold_cache_dir, imports))
+
+            imports_ms = statistics.median(t["imports"] for t in timings) * 1000
+            sprites_ms = statistics.median(t["sprites"] for t in timings) * 1000
+            logging.info(
+                "%s imports, %s cache: %.1f ms imports + %.1f ms sprites",
+                imports,
+                cache,
+                imports_ms,
+                sprites_ms,
+            )
+
+
+BENCHMARKS = {"decoding": benchmark_decoding, "startup": benchmark_startup}
+
+parser = argparse.ArgumentParser(description="Run a performance benchmark.")
+parser.add_argument("benchmark", choices=BENCHMARKS, help="benchmark to run")
+parser.add_argument("--repeat", type=int, help="timed repetitions")
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+logging.info("Running %s benchmark ⏱️", args.benchmark)
+
+BENCHMARKS[args.benchmark](**({"repeat": args.repeat} if args.repeat else {}))
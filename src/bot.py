@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from ai.BotActor import BotActor
+from dog.match_manager import MatchManager
+from enums.Difficulty import Difficulty
+
+parser = argparse.ArgumentParser(
+    description="Serve many Dog matches at once with computer players.",
+)
+parser.add_argument("--matches", type=int, default=10, help="concurrent matches")
+parser.add_argument(
+    "--difficulty",
+    choices=[difficulty.name.lower() for difficulty in Difficulty],
+    default="medium",
+    help="strength of the computer players",
+)
+parser.add_argument("--url", help="Dog server, the configured one by default")
+parser.add_argument("--workers", type=int, default=8, help="network threads")
+parser.add_argument("--searchers", type=int, default=2, help="search threads")
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+logging.info("Running bots 🤖")
+
+manager = MatchManager(args.url, args.workers)
+manager.start()
+searches = ThreadPoolExecutor(args.searchers)
+
+for number in range(args.matches):
+    bot = BotActor(Difficulty[args.difficulty.upper()], searches)
+    manager.add_match(f"bot{number}", bot)
+
+try:
+    manager.stop_event.wait()
+except KeyboardInterrupt:
+    manager.stop()
@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+
+import logging
+from engine.TablebaseBuilder import build_tablebase
+
+logging.basicConfig(level=logging.INFO)
+logging.info("Building tablebase 🧮")
+
+build_tablebase()
@@ -1,12 +1,21 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from dog.dog_proxy import DogProxy
+from dog.match_actor import MatchActor
 from dog.polling_thread import PollingThread
 
 
-class DogActor:
-    def __init__(self):
-        super().__init__()
-        self.proxy = DogProxy()
-        self.player_actor = None
+class DogActor(MatchActor):
+    def __init__(self, url=None):
+        # Blocking calls such as HTTP requests run off the caller's thread, so
+        # the Tk main loop never waits for the network. A single thread keeps
+        # requests in submission order
+        super().__init__(
+            DogProxy(url), ThreadPoolExecutor(1, thread_name_prefix="dog-network")
+        )
+        self.accepting_starts = True
+        # False while the player is busy, e.g. playing against the computer
         self.polling_thread = PollingThread(self.proxy, True)
 
     def initialize(self, player_name, a_player_actor):
@@ -15,17 +24,26 @@ class DogActor:
         self.polling_thread.start()
         return resp_dict
 
-    def start_match(self, number_of_players):
-        return self.proxy.start_match(number_of_players)
+    def initialize_async(self, player_name, a_player_actor):
+        """Register without blocking, returns a future server message."""
+        return self.network.submit(self.initialize, player_name, a_player_actor)
 
-    def send_move(self, move):
-        self.proxy.send_move(move)
+    def wake(self):
+        self.polling_thread.wake()
 
-    def receive_start(self, start_status):
-        self.player_actor.receive_start(start_status)
+    def stop(self):
+        super().stop()
+        self.polling_thread.stop()
+        self.network.shutdown(wait=False, cancel_futures=True)
 
-    def receive_move(self, a_move):
-        self.player_actor.receive_move(a_move)
+    def decline_match(self):
+        """Leave a match started by another player, it is no longer polled."""
+        logging.warning("Ignoring a match started by another player, player busy")
+        self.proxy.status = 2  #   connected without match
+
+    def receive_start(self, start_status):
+        if not self.accepting_starts:
+            self.decline_match()
+            return
 
-    def receive_withdrawal_notification(self):
-        self.player_actor.receive_withdrawal_notification()
+        super().receive_start(start_status)
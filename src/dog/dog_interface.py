@@ -10,3 +10,6 @@ class DogPlayerInterface:
 
     def receive_withdrawal_notification(self):
         print("O método receive_withdrawal_notification() precisa ser sobrescrito")
+
+    def receive_move_failure(self, a_move):
+        print("O método receive_move_failure() precisa ser sobrescrito")
@@ -1,12 +1,41 @@
 import json
+import logging
+import os
+import random
+import time
+from threading import Lock
 from urllib.parse import urldefrag
-import requests
+from dog.move_decoder import MoveDecodeError, decode_move, decode_response
 from dog.start_status import StartStatus
+from models.Move import Move
 
 
 class DogProxy:
-    def __init__(self):
+    DEFAULT_URL = "https://api-dog-server.herokuapp.com/"
+    last_player_id = 0
+    # ids come from the clock, proxies of the same process never share one
+    player_id_lock = Lock()
+
+    def __init__(
+        self,
+        url=None,
+        pool_size=4,
+        connect_timeout=3.05,
+        read_timeout=10,
+        retries=3,
+        backoff=0.5,
+        session=None,
+    ):
         super().__init__()
+        # A single session keeps connections to the server alive between calls,
+        # it may be shared by the proxies of several matches. It is created on
+        # the first request, so importing requests does not delay the startup
+        self.session = session
+        self.pool_size = pool_size
+        self.session_lock = Lock()
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff = backoff
         self.dog_actor = None
         self.player_id = 0
         self.player_name = ""
@@ -14,11 +43,53 @@ class DogProxy:
         self.status = 0
         # 0 - file game.id not found; 1 - not connected to server; 2 - connected without match; 3 - waiting move (even if it's the local player's turn)
         self.move_order = 0
-        self.url = "https://api-dog-server.herokuapp.com/"
+        self.move_number = 0
+        # number of the last handled opponent move, ignores resent moves
+        self.local_turn = False
+        # True while the local player has to move, the opponent can not move
+        self.push_supported = None
+        # None until the server answered a long-poll request
+        self.push_hold = 20
+        # seconds the server holds a long-poll request without news
+        self.url = self.server_url(url)
+
+    @staticmethod
+    def create_session(pool_size):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def server_url(self, url=None):
+        """Base URL of the Dog server.
+
+        Taken from the `url` argument, the `DOG_SERVER_URL` environment
+        variable or the `src/config/server.url` file, in this order, and
+        defaults to the public Dog server.
+        """
+        url = url or os.environ.get("DOG_SERVER_URL")
+        if not url:
+            try:
+                with open("src/config/server.url", "r") as config_file:
+                    url = config_file.read().strip() or self.DEFAULT_URL
+            except FileNotFoundError:
+                url = self.DEFAULT_URL
+        return url if url.endswith("/") else url + "/"
 
     def get_status(self):
         return self.status
 
+    def is_local_turn(self):
+        return self.local_turn
+
+    def is_local_player_first(self, players):
+        # The local player comes first in the players list, order "1" starts
+        return bool(players) and players[0][2] == "1"
+
     def initialize(self, a_name, an_actor):
         self.player_id = self.generate_player_id()
         self.player_name = a_name
@@ -33,8 +104,7 @@ class DogProxy:
             return "Arquivo de configuração do jogo não encontrado"
         config_file.close()
         resp = self.register_player(self.player_name, self.player_id, self.game_id)
-        result = resp.status_code
-        if result == 200:
+        if resp is not None and resp.status_code == 200:
             resp_json = resp.text
             resp_dict = json.loads(resp_json)
             resp1 = resp_dict["0"]
@@ -50,8 +120,46 @@ class DogProxy:
         from time import time
 
         milliseconds = int(time() * 1000)
-        an_id = str(milliseconds - 1639872000000)
-        return an_id
+        with DogProxy.player_id_lock:
+            an_id = max(milliseconds - 1639872000000, DogProxy.last_player_id + 1)
+            DogProxy.last_player_id = an_id
+        return str(an_id)
+
+    def post(self, url, post_data, idempotent=True, timeout=None, retries=None):
+        """POST with retries and jittered exponential backoff.
+
+        Requests that are not idempotent are only retried on connect timeouts,
+        when the request surely never reached the server. `retries` overrides
+        the number of retries of the proxy. Returns `None` when every attempt
+        failed.
+        """
+        import requests
+
+        with self.session_lock:
+            if self.session is None:
+                self.session = self.create_session(self.pool_size)
+
+        retry_errors = (
+            (requests.ConnectionError, requests.Timeout)
+            if idempotent
+            else requests.ConnectTimeout
+        )
+        if retries is None:
+            retries = self.retries
+        for attempt in range(retries + 1):
+            try:
+                return self.session.post(
+                    url, data=post_data, timeout=timeout or self.timeout
+                )
+            except retry_errors as error:
+                if attempt == retries:
+                    logging.warning("Request to %s failed: %s", url, error)
+                    return None
+                delay = self.backoff * 2**attempt
+                time.sleep(random.uniform(delay / 2, delay * 1.5))
+            except requests.RequestException as error:
+                logging.warning("Request to %s failed: %s", url, error)
+                return None
 
     def register_player(self, a_player_name, a_player_id, a_game_id):
         url = self.url + "player/"
@@ -60,7 +168,7 @@ class DogProxy:
             "player_id": a_player_id,
             "game_id": a_game_id,
         }
-        resp = requests.post(url, data=post_data)
+        resp = self.post(url, post_data)
         return resp
 
     def start_match(self, number_of_players):
@@ -70,9 +178,8 @@ class DogProxy:
             "game_id": self.game_id,
             "number_of_players": number_of_players,
         }
-        resp = requests.post(url, data=post_data)
-        result = resp.status_code
-        if result == 200:
+        resp = self.post(url, post_data, idempotent=False)
+        if resp is not None and resp.status_code == 200:
             resp_json = resp.text
             resp_dict = json.loads(resp_json)
             message = resp_dict["message"]
@@ -82,52 +189,138 @@ class DogProxy:
             if code == "2":
                 self.status = 3
                 self.move_order = 0
+                self.move_number = 0
+                self.local_turn = self.is_local_player_first(players)
         else:
             start_status = StartStatus("0", "Voce está offline", [], self.player_id)
         return start_status
 
     def start_status(self):
+        """Poll for a match started by another player, True if one started."""
         url = self.url + "started/"
         post_data = {"player_id": self.player_id, "game_id": self.game_id}
-        resp = requests.post(url, data=post_data)
-        result = resp.status_code
-        if result == 200 and self.status == 2:
-            resp_json = resp.text
-            resp_dict = json.loads(resp_json)
-            message = resp_dict["message"]
-            code = resp_dict["code"]
-            players = resp_dict["players"]
-            if code == "2":
+        resp = self.post(url, post_data)
+        if resp is not None and resp.status_code == 200 and self.status == 2:
+            try:
+                resp_dict = decode_response(resp.text)
+            except MoveDecodeError as error:
+                logging.warning("Ignoring malformed start: %s", error)
+                return False
+            message = resp_dict.get("message")
+            code = resp_dict.get("code")
+            players = resp_dict.get("players")
+            if code == "2" and isinstance(players, list):
                 start_status = StartStatus(code, message, players, self.player_id)
                 self.status = 3
                 self.move_order = 0
+                self.move_number = 0
+                self.local_turn = self.is_local_player_first(players)
                 self.dog_actor.receive_start(start_status)
+                return True
+        return False
+
+    def send_move(self, a_move: Move):
+        """Pass the turn and post the move, see `post_move`."""
+        self.pass_turn(a_move)
+        return self.post_move(a_move)
+
+    def pass_turn(self, a_move: Move):
+        self.local_turn = False
+        if a_move.match_status == "next":
+            self.status = 3  #   pass the turn and start looking for a move
+        elif a_move.match_status == "finished":
+            self.status = 2  #   connected without match
+
+    def post_move(self, a_move: Move):
+        """Post a move, True once the server acknowledged it.
+
+        Returns False when the move may be posted again, e.g. on timeouts
+        or server errors, and None when the server refused it for good: on
+        4xx responses or when the player has no match anymore.
 
-    def send_move(self, a_move):
+        The move number goes along as sequence number, so posting the same
+        move again is harmless: servers supporting it store it only once and
+        the opponent ignores moves numbered below the last one it handled.
+        """
         url = self.url + "move/"
-        json_move = json.dumps(a_move)  # convert move to json
+        # convert move to compact json
+        json_move = json.dumps(a_move.to_dict(), separators=(",", ":"))
         post_data = {
             "player_id": self.player_id,
             "game_id": self.game_id,
             "move": json_move,
+            "seq": a_move.number,
         }
-        resp = requests.post(url, data=post_data)
-        if a_move["match_status"] == "next":
-            self.status = 3  #   pass the turn and start looking for a move
-        elif a_move["match_status"] == "finished":
-            self.status = 2  #   connected without match
-        return resp.text
+        # Not retried here, `MoveQueue` retries moves without blocking
+        resp = self.post(url, post_data, retries=0)
+        if resp is None or resp.status_code >= 500 or resp.status_code in (408, 429):
+            return False
+        if resp.status_code != 200:
+            return None
+        try:
+            code = json.loads(resp.text).get("0")
+        except (ValueError, AttributeError):
+            return True  #   an acknowledgement without details
+        return None if code == "1" else True
 
     def match_status(self):
+        """Poll for the opponent's move, True if a new move or withdrawal came.
+
+        The last handled move order is sent along, so servers supporting it
+        answer 304 Not Modified without a body when nothing changed.
+        """
         url = self.url + "match/"
-        post_data = {"player_id": self.player_id, "game_id": self.game_id}
-        resp = requests.post(url, data=post_data)
-        resp_json = resp.text
-        seek_result = json.loads(resp_json)
+        post_data = {
+            "player_id": self.player_id,
+            "game_id": self.game_id,
+            "order": self.move_order,
+        }
+        resp = self.post(url, post_data)
+        if resp is None or resp.status_code != 200:
+            return False  #   304 - nothing changed, nothing to parse
+        return self.handle_match_result(resp.text)
+
+    def wait_status(self):
+        """Long-poll for the opponent's move.
+
+        The server holds the request until the opponent moves or `push_hold`
+        elapses. Returns True if a new move or withdrawal came, False if
+        nothing happened and None on errors or when the server does not
+        support long-polling, in which case `match_status` must be polled.
+        """
+        url = self.url + "wait/"
+        post_data = {
+            "player_id": self.player_id,
+            "game_id": self.game_id,
+            "order": self.move_order,
+            "hold": self.push_hold,
+        }
+        connect_timeout, read_timeout = self.timeout
+        resp = self.post(
+            url, post_data, timeout=(connect_timeout, read_timeout + self.push_hold)
+        )
+        if resp is None:
+            return None
+        if resp.status_code in (404, 405):
+            self.push_supported = False
+            return None
+        if resp.status_code == 304:
+            self.push_supported = True
+            return False
+        if resp.status_code != 200:
+            return None
+        self.push_supported = True
+        return self.handle_match_result(resp.text)
+
+    def handle_match_result(self, resp_json):
+        try:
+            seek_result = decode_response(resp_json)
+            #   move is contained in seek_result as a string
+            move_dictionary = decode_move(seek_result.get("1")) if seek_result else {}
+        except MoveDecodeError as error:
+            logging.warning("Ignoring malformed move: %s", error)
+            return False
         if bool(seek_result):
-            move_dictionary = eval(
-                seek_result["1"]
-            )  #   move is contained in seek_result as a string (to be converted in dictionary)
             if bool(move_dictionary):
                 match_status = move_dictionary["match_status"]
                 if (
@@ -135,6 +328,7 @@ class DogProxy:
                 ):  #  an opponent has abandoned the match
                     self.dog_actor.receive_withdrawal_notification()
                     self.status = 2
+                    return True
                 else:
                     move_player_id = move_dictionary["player"]
                     move_player_order = move_dictionary["order"]
@@ -145,6 +339,13 @@ class DogProxy:
                             int(move_player_order) > self.move_order
                         ):  #  not an already handled move
                             self.move_order = int(move_player_order)
-                            self.dog_actor.receive_move(move_dictionary)
+                            move = Move.from_dict(move_dictionary)
+                            if move.number <= self.move_number:  #  a resent move
+                                return False
+                            self.move_number = move.number
+                            self.local_turn = True
+                            self.dog_actor.receive_move(move)
                             if move_dictionary["match_status"] == "finished":
                                 self.status = 2
+                            return True
+        return False
@@ -0,0 +1,281 @@
+"""Load test of the Dog protocol with many headless clients.
+
+Every client is a real `DogProxy` polled by a real `PollingThread`, only
+the GUI is replaced by a bot playing random legal moves. Clients are paired
+into matches, each pair with its own game id so pairing is deterministic.
+"""
+
+import logging
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+from urllib.parse import urlparse
+
+from dog.dog_proxy import DogProxy
+from dog.local_server import LocalDogServer
+from dog.move_queue import MoveQueue
+from dog.polling_thread import PollingThread
+from engine import BitBoard
+from models.Move import Move
+
+
+class LoadTestMetrics:
+    """Thread safe counters shared by all clients."""
+
+    def __init__(self):
+        super().__init__()
+        self.lock = Lock()
+        self.requests = {}
+        # endpoint -> number of requests
+        self.errors = 0
+        self.not_modified = 0
+        self.sent_at = {}
+        # (game_id, move number) -> time the move was sent
+        self.delivery_latencies = []
+        self.games_finished = 0
+
+    def add_request(self, url, status_code):
+        endpoint = urlparse(url).path.strip("/")
+        with self.lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            if status_code == 304:
+                self.not_modified += 1
+            elif status_code != 200:
+                self.errors += 1
+
+    def move_sent(self, game_id, number):
+        with self.lock:
+            self.sent_at[(game_id, number)] = time.perf_counter()
+
+    def move_delivered(self, game_id, number):
+        with self.lock:
+            sent_at = self.sent_at.pop((game_id, number), None)
+            if sent_at is not None:
+                self.delivery_latencies.append(time.perf_counter() - sent_at)
+
+    def game_finished(self):
+        with self.lock:
+            self.games_finished += 1
+
+    def summary(self, matches, elapsed):
+        requests = sum(self.requests.values())
+        latencies = sorted(self.delivery_latencies)
+        percentiles = {}
+        if len(latencies) > 1:
+            cuts = statistics.quantiles(latencies, n=100)
+            percentiles = {
+                "p50_ms": cuts[49] * 1000,
+                "p95_ms": cuts[94] * 1000,
+                "p99_ms": cuts[98] * 1000,
+            }
+        return {
+            "matches": matches,
+            "games_finished": self.games_finished,
+            "requests": requests,
+            "requests_per_second": requests / elapsed if elapsed else 0,
+            "requests_by_endpoint": dict(self.requests),
+            "not_modified": self.not_modified,
+            "errors": self.errors,
+            "error_rate": self.errors / requests if requests else 0,
+            "moves_delivered": len(latencies),
+            "delivery_latency": percentiles,
+            "seconds": elapsed,
+        }
+
+
+class LoadTestProxy(DogProxy):
+    """`DogProxy` reporting every request to the load test metrics.
+
+    Requests are counted by the transport adapter, so each attempt of a
+    retried request is counted, and failed attempts count as errors.
+    """
+
+    def __init__(self, url, metrics):
+        super().__init__(url)
+        self.metrics = metrics
+
+    def create_session(self, pool_size):
+        session = DogProxy.create_session(pool_size)
+        # The same adapter is mounted for http:// and https://
+        for adapter in set(session.adapters.values()):
+            adapter.send = self.__counted(adapter.send)
+        return session
+
+    def __counted(self, send):
+        def counted_send(request, *args, **kwargs):
+            try:
+                response = send(request, *args, **kwargs)
+            except Exception:
+                self.metrics.add_request(request.url, None)
+                raise
+            self.metrics.add_request(request.url, response.status_code)
+            return response
+
+        return counted_send
+
+
+class LoadTestClient:
+    """Headless player standing in for `PlayerInterface` and `DogActor`."""
+
+    def __init__(self, player_id, game_id, url, metrics, sender, move_delay=0.0):
+        super().__init__()
+        self.proxy = LoadTestProxy(url, metrics)
+        self.polling_thread = PollingThread(self.proxy, True)
+        self.player_id = player_id
+        self.game_id = game_id
+        self.metrics = metrics
+        self.sender = sender
+        # Stands in for the network executor of `DogActor`, shared by all clients
+        self.moves = MoveQueue(
+            self.proxy, sender, self.move_acknowledged, self.move_failed
+        )
+        self.move_delay = move_delay
+        self.random = random.Random(player_id)
+        self.state = BitBoard.INITIAL_STATE
+        self.opponent = None
+        self.finished = Event()
+
+    def connect(self):
+        # Like `DogProxy.initialize`, with ids unique across clients
+        self.proxy.player_id = self.player_id
+        self.proxy.player_name = "load" + self.player_id
+        self.proxy.game_id = self.game_id
+        self.proxy.dog_actor = self
+        resp = self.proxy.register_player(
+            self.proxy.player_name, self.player_id, self.game_id
+        )
+        self.proxy.status = 2 if resp is not None and resp.status_code == 200 else 1
+        self.polling_thread.start()
+
+    def start_match(self):
+        start_status = self.proxy.start_match(2)
+        self.polling_thread.wake()
+        if start_status.get_code() == "2":
+            self.receive_start(start_status)
+        else:
+            self.finish()
+
+    def stop(self):
+        self.moves.stop()
+        self.polling_thread.stop()
+
+    def receive_start(self, start_status):
+        if self.proxy.is_local_turn():
+            self.play()
+
+    def receive_move(self, move):
+        self.metrics.move_delivered(self.game_id, move.number)
+        self.state = BitBoard.apply_move(self.state, move.from_index, move.to_index)
+        if move.winner:
+            self.finish()
+        else:
+            self.play()
+
+    def receive_withdrawal_notification(self):
+        self.finish()
+
+    def play(self):
+        self.sender.submit(self.__play)
+
+    def move_acknowledged(self, move):
+        self.polling_thread.wake()
+
+    def move_failed(self, move):
+        # Already counted as a request error, the match can not go on
+        self.finish()
+        if self.opponent:
+            self.opponent.finish()
+
+    def finish(self):
+        self.finished.set()
+
+    def __play(self):
+        if self.move_delay:
+            time.sleep(self.random.uniform(0, 2 * self.move_delay))
+
+        moves = list(BitBoard.legal_moves(self.state))
+
+        # Hounds blocked by each other can not move, the match ends here
+        if not moves:
+            self.metrics.game_finished()
+            self.finish()
+            self.opponent.finish()
+            return
+
+        from_index, to_index = self.random.choice(moves)
+        self.state = BitBoard.apply_move(self.state, from_index, to_index)
+        winner = BitBoard.evaluate_winner(self.state)
+        move = Move(from_index, to_index, self.state.move_counter, winner)
+
+        self.metrics.move_sent(self.game_id, move.number)
+        self.proxy.pass_turn(move)
+        self.moves.put(move)
+
+        if winner:
+            self.metrics.game_finished()
+            self.finish()
+
+
+def run_load_test(
+    clients=200,
+    url=None,
+    timeout=120.0,
+    workers=32,
+    move_delay=0.0,
+):
+    """Play `clients / 2` concurrent matches and return the summary.
+
+    Without `url` a `LocalDogServer` is started in this process.
+    """
+    server = None
+    if not url:
+        server = LocalDogServer(port=0).start()
+        url = server.url
+
+    metrics = LoadTestMetrics()
+    matches = clients // 2
+    run_id = str(int(time.time() * 1000))
+    all_clients = []
+
+    with ThreadPoolExecutor(workers) as sender:
+        pairs = []
+        for match in range(matches):
+            game_id = f"load-{run_id}-{match}"
+            host, guest = (
+                LoadTestClient(
+                    f"{run_id}{match:05d}{seat}",
+                    game_id,
+                    url,
+                    metrics,
+                    sender,
+                    move_delay,
+                )
+                for seat in range(2)
+            )
+            host.opponent, guest.opponent = guest, host
+            pairs.append((host, guest))
+            all_clients += [host, guest]
+
+        start = time.perf_counter()
+
+        # Every guest must be registered before its host starts the match
+        list(sender.map(LoadTestClient.connect, all_clients))
+        list(sender.map(LoadTestClient.start_match, [host for host, _ in pairs]))
+
+        deadline = start + timeout
+        for client in all_clients:
+            client.finished.wait(max(deadline - time.perf_counter(), 0))
+
+        elapsed = time.perf_counter() - start
+
+        for client in all_clients:
+            client.stop()
+
+    if server:
+        server.stop()
+
+    summary = metrics.summary(matches, elapsed)
+    logging.info("Load test finished: %s", summary)
+    return summary
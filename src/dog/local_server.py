@@ -0,0 +1,253 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+class DogServerState:
+    """Players and matches of the local Dog server, shared by all requests."""
+
+    def __init__(self):
+        super().__init__()
+        self.players = {}
+        # player_id -> {"name", "game_id", "match", "last_match", "pending_start"}
+        self.matches = {}
+        # match_id -> {"players", "orders", "moves", "sequences"}
+        self.next_match_id = 1
+        self.changed = threading.Condition()
+
+    def register_player(self, player_id, player_name, game_id):
+        with self.changed:
+            self.players[player_id] = {
+                "name": player_name,
+                "game_id": game_id,
+                "match": None,
+                "last_match": None,
+                "pending_start": None,
+            }
+        return {"0": player_id, "1": "Jogador registrado"}
+
+    def start_match(self, player_id, game_id, number_of_players):
+        with self.changed:
+            player = self.players.get(player_id)
+            if player is None:
+                return self.start_response("0", "Jogador não registrado", [])
+            available = [
+                other_id
+                for other_id, other in self.players.items()
+                if other_id != player_id
+                and other["game_id"] == game_id
+                and other["match"] is None
+            ]
+            if len(available) < number_of_players - 1:
+                return self.start_response("1", "Jogadores insuficientes", [])
+
+            match_players = [player_id] + random.sample(
+                available, number_of_players - 1
+            )
+            orders = list(range(1, number_of_players + 1))
+            random.shuffle(orders)
+            match_id = self.next_match_id
+            self.next_match_id += 1
+            self.matches[match_id] = {
+                "players": match_players,
+                "orders": dict(zip(match_players, orders)),
+                "moves": [],
+                "sequences": {},
+            }
+            for match_player_id in match_players:
+                self.players[match_player_id]["match"] = match_id
+                self.players[match_player_id]["last_match"] = match_id
+                if match_player_id != player_id:
+                    self.players[match_player_id]["pending_start"] = match_id
+            self.changed.notify_all()
+            return self.start_response(
+                "2", "Partida iniciada", self.players_list(match_id, player_id)
+            )
+
+    def start_status(self, player_id):
+        with self.changed:
+            player = self.players.get(player_id)
+            if player is None or player["pending_start"] is None:
+                return self.start_response("1", "Aguardando partida", [])
+            match_id = player["pending_start"]
+            # A start is only notified once
+            player["pending_start"] = None
+            return self.start_response(
+                "2", "Partida iniciada", self.players_list(match_id, player_id)
+            )
+
+    def post_move(self, player_id, move, seq=None):
+        with self.changed:
+            player = self.players.get(player_id)
+            if player is None or player["last_match"] is None:
+                return {"0": "1", "1": "Jogador sem partida"}
+            match = self.matches[player["last_match"]]
+            # A resent move is acknowledged again but stored once, even the
+            # last move of a match that is over
+            if seq is not None and match["sequences"].get(player_id) == seq:
+                return {"0": "0", "1": "Jogada registrada"}
+            if player["match"] is None:
+                return {"0": "1", "1": "Jogador sem partida"}
+            match["sequences"][player_id] = seq
+            move["player"] = player_id
+            move["order"] = str(len(match["moves"]) + 1)
+            match["moves"].append(move)
+            if move["match_status"] != "next":
+                for match_player_id in match["players"]:
+                    self.players[match_player_id]["match"] = None
+            self.changed.notify_all()
+            return {"0": "0", "1": "Jogada registrada"}
+
+    def match_status(self, player_id, order=None):
+        """Last move, or nothing if it is not newer than `order`."""
+        with self.changed:
+            if order is None:
+                return self.last_move(player_id)
+            return self.new_move(player_id, order)
+
+    def wait_status(self, player_id, order, hold):
+        """Wait up to `hold` seconds for a move newer than `order`."""
+        deadline = time.monotonic() + hold
+        with self.changed:
+            while True:
+                result = self.new_move(player_id, order)
+                if result:
+                    return result
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return {}
+                self.changed.wait(remaining)
+
+    def last_move(self, player_id):
+        # Moves of finished matches stay readable, like on the Dog server
+        match = self.player_match(player_id)
+        if match is None or not match["moves"]:
+            return {}
+        move = match["moves"][-1]
+        return {"move": move}
+
+    def new_move(self, player_id, order):
+        # Only withdrawals and opponent moves the player did not handle yet
+        result = self.last_move(player_id)
+        if result:
+            move = result["move"]
+            if move["match_status"] == "interrupted" or (
+                move["player"] != player_id and int(move["order"]) > order
+            ):
+                return result
+        return {}
+
+    def player_match(self, player_id):
+        player = self.players.get(player_id)
+        if player is None or player["last_match"] is None:
+            return None
+        return self.matches[player["last_match"]]
+
+    def players_list(self, match_id, player_id):
+        # The requesting player always comes first
+        match = self.matches[match_id]
+        match_players = sorted(match["players"], key=lambda other: other != player_id)
+        return [
+            [self.players[other]["name"], other, str(match["orders"][other])]
+            for other in match_players
+        ]
+
+    def start_response(self, code, message, players):
+        return {"code": code, "message": message, "players": players}
+
+
+class DogRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        fields = parse_qs(self.rfile.read(length).decode())
+        data = {key: values[0] for key, values in fields.items()}
+        state = self.server.state
+
+        endpoint = self.path.strip("/")
+        if endpoint == "player":
+            result = state.register_player(
+                data["player_id"], data["player_name"], data["game_id"]
+            )
+        elif endpoint == "start":
+            result = state.start_match(
+                data["player_id"], data["game_id"], int(data["number_of_players"])
+            )
+        elif endpoint == "started":
+            result = state.start_status(data["player_id"])
+        elif endpoint == "move":
+            result = state.post_move(
+                data["player_id"], json.loads(data["move"]), data.get("seq")
+            )
+        elif endpoint == "match":
+            order = int(data["order"]) if "order" in data else None
+            result = self.encode_move(state.match_status(data["player_id"], order))
+            if order is not None and not result:
+                self.send_not_modified()
+                return
+        elif endpoint == "wait":
+            result = self.encode_move(
+                state.wait_status(
+                    data["player_id"],
+                    int(data.get("order", 0)),
+                    min(float(data.get("hold", 20)), 60),
+                )
+            )
+            if not result:
+                self.send_not_modified()
+                return
+        else:
+            self.send_error(404)
+            return
+
+        body = json.dumps(result).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_not_modified(self):
+        self.send_response(304)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def encode_move(self, result):
+        # The Dog server sends the move as a Python literal string
+        if not result:
+            return {}
+        move = result["move"]
+        return {"0": move.get("order", "0"), "1": repr(move)}
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalDogServer(ThreadingHTTPServer):
+    """Stand-in for the Dog server, supporting long-polling on `wait/`."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+    # Hundreds of clients may connect at once during load tests
+
+    def __init__(self, host="127.0.0.1", port=8000):
+        super().__init__((host, port), DogRequestHandler)
+        self.state = DogServerState()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        """Serve on a background thread."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,61 @@
+from dog.move_queue import MoveQueue
+
+
+class MatchActor:
+    """Match logic shared by `DogActor` and `ManagedMatch`.
+
+    Stands between a proxy and the player actor: starts matches, queues the
+    local moves on the `network` executor and forwards what the proxy
+    receives. Subclasses poll the match and implement `wake`.
+    """
+
+    def __init__(self, proxy, network, player_actor=None):
+        super().__init__()
+        self.proxy = proxy
+        self.network = network
+        self.player_actor = player_actor
+        self.moves = MoveQueue(
+            proxy, network, self.__move_acknowledged, self.__move_failed
+        )
+
+    def wake(self):
+        """Poll the match fast again, e.g. after a move."""
+        raise NotImplementedError
+
+    def start_match(self, number_of_players):
+        start_status = self.proxy.start_match(number_of_players)
+        if start_status.get_code() == "2":
+            self.moves.clear()
+        self.wake()
+        return start_status
+
+    def start_match_async(self, number_of_players):
+        """Start a match without blocking, returns a future `StartStatus`."""
+        return self.network.submit(self.start_match, number_of_players)
+
+    def send_move(self, move):
+        """Queue a move already played locally, it is sent in the background."""
+        self.proxy.pass_turn(move)
+        self.moves.put(move)
+
+    def __move_acknowledged(self, move):
+        # The opponent can only answer once the move reached the server
+        self.wake()
+
+    def __move_failed(self, move):
+        self.player_actor.receive_move_failure(move)
+
+    def stop(self):
+        self.moves.stop()
+
+    def receive_start(self, start_status):
+        # Moves still pending belong to the previous match
+        self.moves.clear()
+        self.player_actor.receive_start(start_status)
+
+    def receive_move(self, a_move):
+        self.player_actor.receive_move(a_move)
+
+    def receive_withdrawal_notification(self):
+        self.moves.clear()
+        self.player_actor.receive_withdrawal_notification()
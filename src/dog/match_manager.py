@@ -0,0 +1,150 @@
+import heapq
+import itertools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread
+
+from dog.dog_proxy import DogProxy
+from dog.match_actor import MatchActor
+
+
+class ManagedMatch(MatchActor):
+    """A match hosted by a `MatchManager`, standing in for a `DogActor`.
+
+    Each match registers as its own player, so its proxy keeps the match
+    state, while connections, threads and polling are shared by the manager.
+    """
+
+    def __init__(self, manager, proxy, player_actor):
+        super().__init__(proxy, manager.executor, player_actor)
+        self.manager = manager
+        self.interval = manager.min_interval
+        self.next_poll = 0.0
+        self.polling = False
+
+    def initialize(self, player_name):
+        return self.proxy.initialize(player_name, self)
+
+    def wake(self):
+        self.manager.wake(self)
+
+
+class MatchManager(Thread):
+    """Hosts many independent matches from a single process.
+
+    Every match polls the Dog server with the same adaptive intervals as
+    `PollingThread`, but a single scheduler thread keeps them in a heap by
+    next poll time and hands due polls to a shared thread pool, which also
+    sends moves over a shared connection pool. Long-polling is not used, as
+    it would hold a pool thread per waiting match.
+    """
+
+    def __init__(
+        self,
+        url=None,
+        workers=8,
+        min_interval=0.25,
+        max_interval=4.0,
+        max_move_interval=1.0,
+        backoff_factor=1.5,
+    ):
+        Thread.__init__(self, daemon=True)
+        self.url = url
+        self.session = DogProxy.create_session(workers * 2)
+        self.executor = ThreadPoolExecutor(workers)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_move_interval = max_move_interval
+        self.backoff_factor = backoff_factor
+        self.matches = []
+        self.schedule = []
+        # heap of (poll time, tie breaker, match), stale when rescheduled
+        self.counter = itertools.count()
+        self.lock = Lock()
+        self.stop_event = Event()
+        self.wake_event = Event()
+
+    def add_match(self, player_name, player_actor):
+        """Register a new player for `player_actor` and host its matches.
+
+        The match is set as `player_actor.match` before it is first polled.
+        """
+        proxy = DogProxy(self.url, session=self.session)
+        proxy.push_supported = False
+        match = ManagedMatch(self, proxy, player_actor)
+        player_actor.match = match
+        message = match.initialize(player_name)
+        logging.info("Match %s: %s", proxy.player_id, message)
+        with self.lock:
+            self.matches.append(match)
+        self.wake(match)
+        return match
+
+    def run(self):
+        while not self.stop_event.is_set():
+            now = time.monotonic()
+            due = []
+            with self.lock:
+                while self.schedule and self.schedule[0][0] <= now:
+                    poll_time, _, match = heapq.heappop(self.schedule)
+                    if poll_time == match.next_poll and not match.polling:
+                        match.polling = True
+                        due.append(match)
+                timeout = self.schedule[0][0] - now if self.schedule else None
+
+            for match in due:
+                self.executor.submit(self.__poll, match)
+
+            # Sleep until the next poll is due, or until woken up or stopped
+            if self.wake_event.wait(timeout):
+                self.wake_event.clear()
+
+    def wake(self, match):
+        """Poll `match` fast again, e.g. after a move."""
+        with self.lock:
+            match.interval = self.min_interval
+            if not match.polling:
+                self.__schedule(match, 0)
+        self.wake_event.set()
+
+    def stop(self):
+        self.stop_event.set()
+        self.wake_event.set()
+        for match in self.matches:
+            match.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def __poll(self, match):
+        proxy = match.proxy
+        status = proxy.get_status()
+        useful = False
+        try:
+            if status == 2:  #   connected without match
+                useful = proxy.start_status()
+            elif status == 3:  #   waiting remote move
+                useful = proxy.match_status()
+        except Exception:
+            logging.exception("Polling match %s failed", proxy.player_id)
+
+        with self.lock:
+            if useful:
+                match.interval = self.min_interval
+            else:
+                match.interval = min(
+                    match.interval * self.backoff_factor, self.max_interval
+                )
+
+            interval = match.interval
+            if proxy.get_status() == 3 and proxy.is_local_turn():
+                interval = self.max_interval
+            elif proxy.get_status() == 3:
+                interval = min(interval, self.max_move_interval)
+
+            match.polling = False
+            self.__schedule(match, interval)
+        self.wake_event.set()
+
+    def __schedule(self, match, delay):
+        match.next_poll = time.monotonic() + delay
+        heapq.heappush(self.schedule, (match.next_poll, next(self.counter), match))
@@ -0,0 +1,135 @@
+"""Decoding of the moves polled from the Dog server, without `eval`.
+
+The Dog server returns the last move as a string holding a Python literal,
+e.g. `{'move': [0, 4, 1], 'winner': None, 'match_status': 'next', ...}`.
+Their strings and constants are translated to JSON, which is much cheaper
+to parse, and only fall back to `ast.literal_eval` when the translation
+fails. Decoded moves are validated before they reach the board.
+"""
+
+import ast
+import json
+import re
+
+from engine import BitBoard
+from enums.Animal import Animal
+
+MATCH_STATUSES = {"next", "finished", "interrupted"}
+WINNERS = {animal.value for animal in Animal}
+NODE_INDEXES = range(BitBoard.NODE_COUNT)
+MOVE_NUMBERS = range(1, BitBoard.MAX_MOVES + 2)
+
+_LITERAL_TOKENS = re.compile(r"'([^']*)'|\b(None|True|False)\b")
+"""Single quoted strings, or the Python constants outside of them"""
+_JSON_CONSTANTS = {"None": "null", "True": "true", "False": "false"}
+
+_LITERAL_ERRORS = (ValueError, TypeError, SyntaxError, MemoryError, RecursionError)
+
+
+class MoveDecodeError(ValueError):
+    pass
+
+
+def decode_response(text: str):
+    """Dictionary from the JSON body of a Dog server response.
+
+    Raises `MoveDecodeError` on bodies that are not a JSON object, e.g. the
+    error page of a proxy in front of the server.
+    """
+    try:
+        response = json.loads(text)
+    except json.JSONDecodeError as error:
+        raise MoveDecodeError(f"Invalid response: {error}") from None
+
+    if not isinstance(response, dict):
+        raise MoveDecodeError(f"Response is not an object: {response!r}")
+
+    return response
+
+
+def decode_move(text: str):
+    """Validated move dictionary from a polled move string.
+
+    Returns an empty dictionary when there is no move yet and raises
+    `MoveDecodeError` on malformed moves.
+    """
+    if not isinstance(text, str):
+        raise MoveDecodeError(f"Move is not a string: {text!r}")
+
+    move = _parse(text)
+    validate_move(move)
+    return move
+
+
+def _parse(text: str):
+    # Python literals without quotes or escapes inside strings map to JSON
+    json_text = text
+    if '"' not in text and "\\" not in text:
+        json_text = _LITERAL_TOKENS.sub(_to_json_token, text)
+
+    try:
+        return json.loads(json_text)
+    except json.JSONDecodeError:
+        pass
+
+    try:
+        return ast.literal_eval(text)
+    except _LITERAL_ERRORS as error:
+        raise MoveDecodeError(f"Invalid move literal: {error}") from None
+
+
+def _to_json_token(match: re.Match):
+    string, constant = match.groups()
+    if constant:
+        return _JSON_CONSTANTS[constant]
+    return f'"{string}"'
+
+
+def validate_move(move):
+    if not isinstance(move, dict):
+        raise MoveDecodeError(f"Move is not a dictionary: {move!r}")
+
+    # No move was played yet
+    if not move:
+        return
+
+    match_status = move.get("match_status")
+    if match_status not in MATCH_STATUSES:
+        raise MoveDecodeError(f"Invalid match status: {match_status!r}")
+
+    # Withdrawals carry no move
+    if match_status == "interrupted":
+        return
+
+    indexes = move.get("move")
+    if not (
+        isinstance(indexes, list)
+        and len(indexes) == 3
+        and all(type(index) is int for index in indexes)
+    ):
+        raise MoveDecodeError(f"Invalid move: {indexes!r}")
+
+    from_index, to_index, number = indexes
+    if (
+        from_index not in NODE_INDEXES
+        or to_index not in NODE_INDEXES
+        or number not in MOVE_NUMBERS
+    ):
+        raise MoveDecodeError(f"Move out of range: {indexes!r}")
+
+    winner = move.get("winner")
+    if winner is None:
+        valid_winner = match_status == "next"
+    else:
+        valid_winner = isinstance(winner, str) and winner in WINNERS
+        valid_winner = valid_winner and match_status == "finished"
+    if not valid_winner:
+        raise MoveDecodeError(f"Invalid winner for {match_status}: {winner!r}")
+
+    player = move.get("player")
+    order = move.get("order")
+    valid_order = (type(order) is int and order >= 0) or (
+        isinstance(order, str) and order.isdecimal()
+    )
+    if not isinstance(player, str) or not valid_order:
+        raise MoveDecodeError(f"Invalid player or order: {player!r}, {order!r}")
@@ -0,0 +1,134 @@
+import logging
+import random
+from collections import deque
+from threading import Event, Lock, Timer, current_thread
+
+
+class MoveQueue:
+    """Outbound moves, posted in order until the server acknowledges them.
+
+    Moves are already played on the local board when queued, so the caller
+    never waits for the network. Pending moves are posted one after the other
+    on the network worker; a failed post is retried with capped exponential
+    backoff, which is safe since moves carry their number as sequence number.
+    Retries are scheduled with a timer, so the worker runs other requests in
+    the meantime.
+
+    A move the server refuses, or that is still not acknowledged after
+    `max_attempts` posts, is given up along with the moves queued after it,
+    which the opponent could not follow anyway, and reported to `on_failed`.
+    """
+
+    def __init__(
+        self,
+        proxy,
+        worker,
+        on_acknowledged=None,
+        on_failed=None,
+        max_delay=8.0,
+        max_attempts=8,
+    ):
+        super().__init__()
+        self.proxy = proxy
+        self.worker = worker
+        self.on_acknowledged = on_acknowledged
+        self.on_failed = on_failed
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.pending = deque()
+        self.lock = Lock()
+        self.flushing = False
+        self.retry_timer = None
+        self.attempts = 0
+        # posts of the first pending move so far
+        self.stop_event = Event()
+        self.acknowledged = 0
+        # number of the last move the server acknowledged
+        self.retries = 0
+
+    def put(self, move):
+        with self.lock:
+            self.pending.append(move)
+            if self.flushing:
+                return
+            self.flushing = True
+        self.worker.submit(self.flush)
+
+    def flush(self):
+        while not self.stop_event.is_set():
+            with self.lock:
+                if not self.pending:
+                    self.flushing = False
+                    return
+                move = self.pending[0]
+
+            acknowledged = self.proxy.post_move(move)
+
+            with self.lock:
+                # The moves were dropped meanwhile, e.g. a new match started
+                if not self.pending or self.pending[0] is not move:
+                    continue
+
+                self.attempts += 1
+                given_up = acknowledged is None or self.attempts >= self.max_attempts
+                if acknowledged:
+                    self.pending.popleft()
+                    self.attempts = 0
+                elif given_up:
+                    self.pending.clear()
+                    self.attempts = 0
+                    self.flushing = False
+                else:
+                    self.retries += 1
+                    self.__schedule_retry()
+
+            if acknowledged:
+                self.acknowledged = move.number
+                if self.on_acknowledged:
+                    self.on_acknowledged(move)
+                continue
+
+            if not given_up:
+                logging.warning("Move %d not acknowledged, resending", move.number)
+                return
+
+            logging.error("Move %d not accepted by the server, giving up", move.number)
+            if self.on_failed:
+                self.on_failed(move)
+            return
+
+    def __schedule_retry(self):
+        delay = min(self.proxy.backoff * 2 ** (self.attempts - 1), self.max_delay)
+        timer = Timer(random.uniform(delay / 2, delay * 1.5), self.__retry)
+        timer.daemon = True
+        self.retry_timer = timer
+        timer.start()
+
+    def __retry(self):
+        with self.lock:
+            # Cancelled by `clear` or `stop`
+            if self.retry_timer is not current_thread() or self.stop_event.is_set():
+                return
+            self.retry_timer = None
+        self.worker.submit(self.flush)
+
+    def clear(self):
+        """Drop the pending moves, e.g. once their match is over."""
+        with self.lock:
+            self.pending.clear()
+            self.attempts = 0
+            if self.retry_timer:
+                self.retry_timer.cancel()
+                self.retry_timer = None
+                self.flushing = False
+
+    def has_pending(self):
+        with self.lock:
+            return bool(self.pending)
+
+    def stop(self):
+        self.stop_event.set()
+        with self.lock:
+            if self.retry_timer:
+                self.retry_timer.cancel()
+                self.retry_timer = None
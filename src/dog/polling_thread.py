@@ -1,17 +1,122 @@
-from threading import Thread
+import logging
 import time
+from threading import Event, Thread
 
 
 class PollingThread(Thread):
-    def __init__(self, a_proxy, daemon_value):
+    """Polls the Dog server with adaptive intervals.
+
+    Polling is fast right after something happened (a local move, a match
+    start or a received move) and backs off exponentially while nothing
+    changes: up to `max_interval` in the lobby, but only up to
+    `max_move_interval` while waiting for the opponent's move, which should
+    arrive quickly. During the local player's turn the opponent can not
+    move, so the match is only polled at the slowest rate to notice
+    withdrawals.
+
+    While waiting for the opponent, servers supporting long-polling push the
+    move as soon as it is made. When a long-poll fails the match is polled
+    instead, and servers without the `wait/` endpoint, or failing it
+    repeatedly, fall back to polling for good.
+    """
+
+    def __init__(
+        self,
+        a_proxy,
+        daemon_value,
+        min_interval=0.25,
+        max_interval=4.0,
+        max_move_interval=1.0,
+        backoff_factor=1.5,
+        max_push_failures=3,
+    ):
         Thread.__init__(self, daemon=daemon_value)
         self.proxy = a_proxy
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_move_interval = max_move_interval
+        self.backoff_factor = backoff_factor
+        self.max_push_failures = max_push_failures
+        self.push_failures = 0
+        self.interval = min_interval
+        self.polls = 0
+        self.useful_polls = 0
+        self.stop_event = Event()
+        self.wake_event = Event()
 
     def run(self):
-        while True:
+        while not self.stop_event.is_set():
             status = self.proxy.get_status()
+            useful = False
             if status == 2:  #   connected without match
-                self.proxy.start_status()
+                useful = self.poll(self.proxy.start_status)
             elif status == 3:  #   waiting remote move
-                self.proxy.match_status()
-            time.sleep(1)  # Sleep for 1 second
+                if self.use_push():
+                    started = time.monotonic()
+                    pushed = self.poll(self.proxy.wait_status)
+                    if pushed is not None:
+                        self.push_failures = 0
+                        self.interval = self.min_interval
+                        # The server already waited for news, ask again soon,
+                        # but not in a tight loop if it answered right away
+                        remaining = self.min_interval - (time.monotonic() - started)
+                        if remaining > 0 and self.wake_event.wait(remaining):
+                            self.wake_event.clear()
+                        continue
+                    self.push_failed()
+
+                useful = self.poll(self.proxy.match_status)
+
+            if useful:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(
+                    self.interval * self.backoff_factor, self.max_interval
+                )
+
+            interval = self.interval
+            if status == 3 and self.proxy.is_local_turn():
+                interval = self.max_interval
+            elif status == 3:
+                interval = min(interval, self.max_move_interval)
+
+            # Sleep until the interval elapses, or until woken up or stopped
+            if self.wake_event.wait(interval):
+                self.wake_event.clear()
+                self.interval = self.min_interval
+
+    def use_push(self):
+        return self.proxy.push_supported is not False and not self.proxy.is_local_turn()
+
+    def push_failed(self):
+        self.push_failures += 1
+        if self.push_failures >= self.max_push_failures:
+            logging.warning("Long-polling keeps failing, polling the match instead")
+            self.proxy.push_supported = False
+
+    def poll(self, request):
+        self.polls += 1
+        # A failing poll must not end the thread, the next one may succeed
+        try:
+            result = request()
+        except Exception:
+            logging.exception("Polling the Dog server failed")
+            return None
+        if result:
+            self.useful_polls += 1
+        return result
+
+    def wake(self):
+        """Poll fast again, e.g. after a local move."""
+        self.wake_event.set()
+
+    def stop(self):
+        self.stop_event.set()
+        self.wake_event.set()
+
+    def get_metrics(self):
+        return {
+            "polls": self.polls,
+            "useful_polls": self.useful_polls,
+            "interval": self.interval,
+        }
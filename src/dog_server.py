@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+
+import argparse
+import logging
+from dog.local_server import LocalDogServer
+
+parser = argparse.ArgumentParser(
+    description="Run a local Dog server for offline and LAN matches.",
+    epilog="Point clients to it with DOG_SERVER_URL=http://<host>:<port>/",
+)
+parser.add_argument(
+    "--host", default="127.0.0.1", help="address to bind, 0.0.0.0 for LAN matches"
+)
+parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+logging.info("Running Dog server 🐶")
+
+server = LocalDogServer(args.host, args.port)
+logging.info("Listening on %s", server.url)
+
+try:
+    server.serve_forever()
+except KeyboardInterrupt:
+    server.server_close()
@@ -0,0 +1,200 @@
+"""Compact bitboard representation of the 11 node Hare and Hounds board.
+
+Nodes are indexed by column and then by row, so node 0 is the leftmost node
+and node 10 the rightmost one. Hounds are stored as an 11 bit mask and the
+Hare as a node index, which turns every rule check into a few bit operations.
+"""
+
+from typing import NamedTuple
+
+from enums.Animal import Animal
+
+ROWS = 3
+COLS = 5
+
+MAX_MOVES = 50
+"""Number of moves after which the Hare wins if it was not trapped"""
+
+# Lattice coordinates (column, row) of every node, skipping the 4 corners
+NODES = [
+    (col, row)
+    for col in range(COLS)
+    for row in range(ROWS)
+    if not ((row == 0 or row == ROWS - 1) and (col == 0 or col == COLS - 1))
+]
+
+NODE_COUNT = len(NODES)
+FULL_MASK = (1 << NODE_COUNT) - 1
+
+COLUMNS = [col for col, _ in NODES]
+
+NODE_INDEXES = {node: index for index, node in enumerate(NODES)}
+
+
+def node_index(x: int, y: int):
+    """Index of the node at column `x` and row `y`, `None` if off the board."""
+    return NODE_INDEXES.get((x, y))
+
+
+def _build_adjacent_masks():
+    masks = []
+
+    for col, row in NODES:
+        mask = 0
+
+        for other_index, (other_col, other_row) in enumerate(NODES):
+            d_col, d_row = abs(other_col - col), abs(other_row - row)
+
+            # Orthogonal neighbours are always connected, diagonal neighbours
+            # only when row + col is odd
+            if d_col + d_row == 1 or (
+                d_col == 1 and d_row == 1 and (col + row) % 2 == 1
+            ):
+                mask |= 1 << other_index
+
+        masks.append(mask)
+
+    return masks
+
+
+ADJACENT_MASKS = _build_adjacent_masks()
+"""Mask of the nodes adjacent to each node"""
+
+LEFT_MASKS = [
+    sum(1 << i for i, other_col in enumerate(COLUMNS) if other_col < col)
+    for col in COLUMNS
+]
+"""Mask of the nodes in a column strictly on the left of each node"""
+
+HARE_MOVE_MASKS = ADJACENT_MASKS
+"""Mask of the nodes the Hare may move to from each node, when empty"""
+
+# Hounds may not move backwards
+HOUND_MOVE_MASKS = [mask & ~LEFT_MASKS[i] for i, mask in enumerate(ADJACENT_MASKS)]
+"""Mask of the nodes a Hound may move to from each node, when empty"""
+
+MASK_NODES = [
+    tuple(i for i in range(NODE_COUNT) if mask & (1 << i))
+    for mask in range(FULL_MASK + 1)
+]
+"""Node indexes set in every possible mask, to iterate masks without bit scans"""
+
+
+class BitState(NamedTuple):
+    hounds: int
+    """Mask of the nodes occupied by Hounds"""
+
+    hare: int
+    """Index of the node occupied by the Hare"""
+
+    hounds_to_move: bool
+    move_counter: int
+
+    @property
+    def turn(self):
+        return Animal.HOUND if self.hounds_to_move else Animal.HARE
+
+    @property
+    def occupied(self):
+        return self.hounds | (1 << self.hare)
+
+    def pack(self):
+        """Pack the state into a single integer, suitable as a hash key."""
+        return (
+            self.hounds
+            | self.hare << NODE_COUNT
+            | self.hounds_to_move << (NODE_COUNT + 4)
+            | self.move_counter << (NODE_COUNT + 5)
+        )
+
+
+# Hounds start on the leftmost node and its two diagonal neighbours, the Hare
+# on the rightmost node. Starting animal is always HOUND.
+INITIAL_STATE = BitState(
+    hounds=(
+        (1 << node_index(0, 1)) | (1 << node_index(1, 0)) | (1 << node_index(1, 2))
+    ),
+    hare=NODE_COUNT - 1,
+    hounds_to_move=True,
+    move_counter=0,
+)
+
+
+def is_hare_escaped(state: BitState):
+    # The Hare escaped if there is no Hound on its left
+    return not state.hounds & LEFT_MASKS[state.hare]
+
+
+def is_hare_trapped(state: BitState):
+    # The Hare is trapped if every adjacent node is occupied
+    adjacent = ADJACENT_MASKS[state.hare]
+    return state.hounds & adjacent == adjacent
+
+
+def evaluate_winner(state: BitState):
+    """Winner of the match right after the last move of `state`, if any.
+
+    The move limit is checked against the moves played before the last one.
+    """
+    if state.move_counter == 0:
+        return None
+
+    if is_hare_trapped(state):
+        return Animal.HOUND
+
+    if is_hare_escaped(state) or state.move_counter > MAX_MOVES:
+        return Animal.HARE
+
+    return None
+
+
+def is_legal_move(state: BitState, from_index: int, to_index: int):
+    if state.hounds_to_move:
+        if not state.hounds & (1 << from_index):
+            return False
+        targets = HOUND_MOVE_MASKS[from_index]
+
+    else:
+        if state.hare != from_index:
+            return False
+        targets = HARE_MOVE_MASKS[from_index]
+
+    return bool(targets & ~state.occupied & (1 << to_index))
+
+
+def legal_targets(state: BitState, from_index: int):
+    """Mask of the nodes the piece at `from_index` may move to."""
+    if state.hounds_to_move:
+        if not state.hounds & (1 << from_index):
+            return 0
+        return HOUND_MOVE_MASKS[from_index] & ~state.occupied
+
+    if state.hare != from_index:
+        return 0
+    return HARE_MOVE_MASKS[from_index] & ~state.occupied
+
+
+def legal_moves(state: BitState):
+    """Yield every legal `(from_index, to_index)` move for the side to move."""
+    empty = FULL_MASK & ~state.occupied
+
+    if state.hounds_to_move:
+        for from_index in MASK_NODES[state.hounds]:
+            for to_index in MASK_NODES[HOUND_MOVE_MASKS[from_index] & empty]:
+                yield from_index, to_index
+
+    else:
+        for to_index in MASK_NODES[HARE_MOVE_MASKS[state.hare] & empty]:
+            yield state.hare, to_index
+
+
+def apply_move(state: BitState, from_index: int, to_index: int):
+    """Return the state after moving a piece, the move is not validated."""
+    hounds, hare = state.hounds, state.hare
+
+    if state.hounds_to_move:
+        hounds ^= (1 << from_index) | (1 << to_index)
+    else:
+        hare = to_index
+
+    return BitState(hounds, hare, not state.hounds_to_move, state.move_counter + 1)
@@ -0,0 +1,173 @@
+from enums.Animal import Animal
+from engine import BitBoard
+from engine.BitBoard import BitState
+from models.Piece import Piece
+from models.Position import Position
+
+
+class GameEngine:
+    """Headless Hare and Hounds rules engine.
+
+    Positions are laid out on the board's 3x5 lattice, where `x` is the
+    column and `y` is the row, so the engine never needs a display. Views
+    translate lattice coordinates into pixels.
+
+    Rules are evaluated on a `BitState`, the `Position` and `Piece` objects
+    are kept in sync for the views.
+    """
+
+    MAX_MOVES = BitBoard.MAX_MOVES
+    """Number of moves after which the Hare wins if it was not trapped"""
+
+    ROWS = BitBoard.ROWS
+    COLS = BitBoard.COLS
+
+    __positions: list[Position]
+    __position_indexes: dict[Position, int]
+    __pieces: tuple[Piece, list[Piece]]  # Hare, Hounds
+    __state: BitState
+    __winner: Animal | None
+
+    def __init__(self):
+        self.__init_positions()
+        self.reset()
+
+    @property
+    def positions(self):
+        return self.__positions
+
+    @property
+    def state(self):
+        return self.__state
+
+    @property
+    def hare(self):
+        return self.__pieces[0]
+
+    @property
+    def hounds(self):
+        return self.__pieces[1]
+
+    @property
+    def turn(self):
+        return self.__state.turn
+
+    @property
+    def move_counter(self):
+        return self.__state.move_counter
+
+    @property
+    def winner(self):
+        return self.__winner
+
+    def is_finished(self):
+        return self.__winner is not None
+
+    def reset(self):
+        for position in self.__positions:
+            position.piece = None
+
+        self.__state = BitBoard.INITIAL_STATE
+        self.__winner = None
+        self.__init_pieces()
+
+    def get_position(self, x: int, y: int):
+        index = BitBoard.node_index(x, y)
+
+        if index is None:
+            return None
+
+        return self.__positions[index]
+
+    def get_position_index(self, position: Position):
+        return self.__position_indexes[position]
+
+    def is_valid_move(self, from_position: Position, to_position: Position | None):
+        if not to_position or self.is_finished():
+            return False
+
+        return BitBoard.is_legal_move(
+            self.__state,
+            self.__position_indexes[from_position],
+            self.__position_indexes[to_position],
+        )
+
+    def is_valid_next_move(self, from_index: int, to_index: int, number: int):
+        """Whether a received move is legal and follows the last move played."""
+        return number == self.move_counter + 1 and self.is_valid_move(
+            self.__positions[from_index], self.__positions[to_index]
+        )
+
+    def legal_moves(self):
+        """Yield every legal `(from_position, to_position)` move."""
+        if self.is_finished():
+            return
+
+        for from_index, to_index in BitBoard.legal_moves(self.__state):
+            yield self.__positions[from_index], self.__positions[to_index]
+
+    def legal_targets(self, from_position: Position):
+        """Positions the piece at `from_position` may move to."""
+        if self.is_finished():
+            return []
+
+        mask = BitBoard.legal_targets(
+            self.__state, self.__position_indexes[from_position]
+        )
+        return [self.__positions[index] for index in BitBoard.MASK_NODES[mask]]
+
+    def move(self, from_position: Position, to_position: Position):
+        """Move the piece at `from_position` and return the winner, if any.
+
+        The move is not validated, call `is_valid_move` beforehand.
+        """
+        self.__state = BitBoard.apply_move(
+            self.__state,
+            self.__position_indexes[from_position],
+            self.__position_indexes[to_position],
+        )
+
+        piece = from_position.piece
+        piece.position = to_position
+
+        winner = self.evaluate_match_winner()
+        if winner:
+            self.__winner = winner
+
+        return winner
+
+    def set_winner(self, animal: Animal):
+        self.__winner = animal
+
+    def evaluate_hare_win(self):
+        return (
+            BitBoard.is_hare_escaped(self.__state)
+            or self.__state.move_counter > self.MAX_MOVES
+        )
+
+    def evaluate_hound_win(self):
+        return BitBoard.is_hare_trapped(self.__state)
+
+    def evaluate_match_winner(self):
+        return BitBoard.evaluate_winner(self.__state)
+
+    def __init_positions(self):
+        self.__positions = [Position(x, y) for x, y in BitBoard.NODES]
+        self.__position_indexes = {
+            position: index for index, position in enumerate(self.__positions)
+        }
+
+        for index, position in enumerate(self.__positions):
+            for other_index, other_position in enumerate(self.__positions):
+                if BitBoard.ADJACENT_MASKS[index] & (1 << other_index):
+                    position.add_adjacent_position(other_position)
+
+    def __init_pieces(self):
+        hounds = [
+            Piece(Animal.HOUND, position)
+            for index, position in enumerate(self.__positions)
+            if self.__state.hounds & (1 << index)
+        ]
+        hare = Piece(Animal.HARE, self.__positions[self.__state.hare])
+
+        self.__pieces = (hare, hounds)
@@ -0,0 +1,90 @@
+"""Perfect-play tablebase format shared by the builder and the readers.
+
+A position is ranked as `(move_counter * NODE_COUNT + hare) * HOUND_SETS +
+hound_set_rank`, where the hound set rank is the index of the 3 Hounds mask in
+the combinatorial number system. The side to move is implied by the move
+counter, since Hounds always play the even moves.
+
+File layout, all little endian:
+
+- header: magic, version, max moves, state count
+- one `RECORD` per state, in rank order, so a lookup reads a single record:
+  - outcome (int8): 1 if the side to move wins, -1 if it loses and 0 for
+    states that can not be played (Hare on a Hound or match finished)
+  - distance (uint8): number of plies until the match ends
+  - best move (uint8): `from_index * NODE_COUNT + to_index` or `NO_MOVE`
+"""
+
+import struct
+from math import comb
+
+from engine import BitBoard
+from engine.BitBoard import BitState
+
+HOUNDS_COUNT = 3
+HOUND_SETS = comb(BitBoard.NODE_COUNT, HOUNDS_COUNT)
+POSITIONS = BitBoard.NODE_COUNT * HOUND_SETS
+"""Number of piece placements for a single move counter"""
+
+LAYERS = BitBoard.MAX_MOVES + 1
+"""Move counters from which a move can still be played"""
+
+STATE_COUNT = LAYERS * POSITIONS
+
+MAGIC = b"HHTB"
+VERSION = 2
+HEADER = struct.Struct("<4sHHI")
+RECORD = struct.Struct("<bBB")
+
+WIN = 1
+LOSS = -1
+UNKNOWN = 0
+NO_MOVE = 255
+
+TABLEBASE_PATH = "src/config/tablebase.bin"
+
+
+def _rank_hound_sets():
+    ranks = [-1] * (BitBoard.FULL_MASK + 1)
+    masks = []
+
+    for mask, nodes in enumerate(BitBoard.MASK_NODES):
+        if len(nodes) != HOUNDS_COUNT:
+            continue
+
+        # Combinatorial number system, nodes are sorted in ascending order
+        ranks[mask] = sum(comb(node, i + 1) for i, node in enumerate(nodes))
+
+    for rank in range(HOUND_SETS):
+        masks.append(ranks.index(rank))
+
+    return ranks, masks
+
+
+HOUND_SET_RANKS, HOUND_SET_MASKS = _rank_hound_sets()
+"""Rank of every 3 Hounds mask (-1 for other masks) and its inverse"""
+
+
+def rank_position(hounds: int, hare: int):
+    return hare * HOUND_SETS + HOUND_SET_RANKS[hounds]
+
+
+def unrank_position(position: int):
+    hare, hound_set = divmod(position, HOUND_SETS)
+    return HOUND_SET_MASKS[hound_set], hare
+
+
+def rank(state: BitState):
+    """Index of `state` in the tablebase arrays."""
+    return state.move_counter * POSITIONS + rank_position(state.hounds, state.hare)
+
+
+def encode_move(from_index: int, to_index: int):
+    return from_index * BitBoard.NODE_COUNT + to_index
+
+
+def decode_move(move: int):
+    if move == NO_MOVE:
+        return None
+
+    return divmod(move, BitBoard.NODE_COUNT)
@@ -0,0 +1,214 @@
+"""Retrograde analysis of Hare and Hounds.
+
+Every move increases the move counter, so the game graph is layered by move
+counter and has no cycles. The solver starts from the last layer, where every
+move ends the match, and propagates outcomes backwards one layer at a time,
+processing all the positions of a layer at once with NumPy.
+
+Winners pick the fastest win and losers the slowest loss. A side without legal
+moves loses, which can only happen to Hounds blocked by each other.
+"""
+
+import logging
+import time
+
+import numpy as np
+
+from engine import BitBoard, Tablebase
+from engine.BitBoard import BitState
+
+NO_WINNER, HARE_WINNER, HOUND_WINNER = 0, 1, 2
+
+
+class TablebaseBuilder:
+    __successors: dict[bool, np.ndarray]
+    """Successor position of every move, -1 padded, by side to move"""
+
+    __moves: dict[bool, np.ndarray]
+    """Encoded move of every successor, by side to move"""
+
+    __winners: np.ndarray
+    """Winner right after a move leading to each position, ignoring the limit"""
+
+    __trapped: np.ndarray
+    __valid: np.ndarray
+    """Positions where the Hare is not on top of a Hound"""
+
+    __outcome: np.ndarray
+    __distance: np.ndarray
+    __best_move: np.ndarray
+
+    def __init__(self):
+        self.__init_positions()
+
+    @property
+    def outcome(self):
+        return self.__outcome
+
+    @property
+    def distance(self):
+        return self.__distance
+
+    @property
+    def best_move(self):
+        return self.__best_move
+
+    def build(self):
+        shape = (Tablebase.LAYERS, Tablebase.POSITIONS)
+        self.__outcome = np.zeros(shape, dtype=np.int8)
+        self.__distance = np.zeros(shape, dtype=np.uint8)
+        self.__best_move = np.full(shape, Tablebase.NO_MOVE, dtype=np.uint8)
+
+        for move_counter in reversed(range(Tablebase.LAYERS)):
+            self.__solve_layer(move_counter)
+
+        return self
+
+    def write(self, path: str = Tablebase.TABLEBASE_PATH):
+        with open(path, "wb") as file:
+            file.write(
+                Tablebase.HEADER.pack(
+                    Tablebase.MAGIC,
+                    Tablebase.VERSION,
+                    BitBoard.MAX_MOVES,
+                    Tablebase.STATE_COUNT,
+                )
+            )
+            records = np.stack(
+                (
+                    self.__outcome.view(np.uint8).ravel(),
+                    self.__distance.ravel(),
+                    self.__best_move.ravel(),
+                ),
+                axis=1,
+            )
+            records.tofile(file)
+
+    def __init_positions(self):
+        positions = Tablebase.POSITIONS
+
+        self.__valid = np.zeros(positions, dtype=bool)
+        self.__trapped = np.zeros(positions, dtype=bool)
+        self.__winners = np.zeros(positions, dtype=np.int8)
+
+        moves: dict[bool, list[list[tuple[int, int]]]] = {True: [], False: []}
+
+        for position in range(positions):
+            hounds, hare = Tablebase.unrank_position(position)
+
+            for hounds_to_move in (True, False):
+                moves[hounds_to_move].append([])
+
+            if hounds & (1 << hare):
+                continue
+
+            # The move counter only matters to check the move limit, which is
+            # handled separately
+            state = BitState(hounds, hare, True, 1)
+            self.__valid[position] = True
+            self.__trapped[position] = BitBoard.is_hare_trapped(state)
+
+            if self.__trapped[position]:
+                self.__winners[position] = HOUND_WINNER
+            elif BitBoard.is_hare_escaped(state):
+                self.__winners[position] = HARE_WINNER
+
+            for hounds_to_move in (True, False):
+                state = BitState(hounds, hare, hounds_to_move, 0)
+
+                for from_index, to_index in BitBoard.legal_moves(state):
+                    next_state = BitBoard.apply_move(state, from_index, to_index)
+                    moves[hounds_to_move][-1].append(
+                        (
+                            Tablebase.rank_position(next_state.hounds, next_state.hare),
+                            Tablebase.encode_move(from_index, to_index),
+                        )
+                    )
+
+        self.__successors = {}
+        self.__moves = {}
+
+        for hounds_to_move, position_moves in moves.items():
+            width = max(len(items) for items in position_moves)
+            successors = np.full((positions, width), -1, dtype=np.int32)
+            encoded = np.full((positions, width), Tablebase.NO_MOVE, dtype=np.uint8)
+
+            for position, items in enumerate(position_moves):
+                for i, (successor, move) in enumerate(items):
+                    successors[position, i] = successor
+                    encoded[position, i] = move
+
+            self.__successors[hounds_to_move] = successors
+            self.__moves[hounds_to_move] = encoded
+
+    def __solve_layer(self, move_counter: int):
+        hounds_to_move = move_counter % 2 == 0
+        mover = HOUND_WINNER if hounds_to_move else HARE_WINNER
+
+        successors = self.__successors[hounds_to_move]
+        has_move = successors >= 0
+        safe_successors = np.where(has_move, successors, 0)
+
+        # Winner right after each move
+        if move_counter == BitBoard.MAX_MOVES:
+            winners = np.where(
+                self.__trapped[safe_successors], HOUND_WINNER, HARE_WINNER
+            )
+        else:
+            winners = self.__winners[safe_successors]
+
+        immediate = winners != NO_WINNER
+
+        if move_counter + 1 < Tablebase.LAYERS:
+            child_outcome = self.__outcome[move_counter + 1][safe_successors]
+            child_distance = self.__distance[move_counter + 1][safe_successors]
+        else:
+            child_outcome = np.zeros_like(safe_successors, dtype=np.int8)
+            child_distance = np.zeros_like(safe_successors, dtype=np.uint8)
+
+        outcome = np.where(
+            immediate,
+            np.where(winners == mover, Tablebase.WIN, Tablebase.LOSS),
+            -child_outcome,
+        )
+        distance = np.where(immediate, 1, child_distance.astype(np.int32) + 1)
+
+        # Fastest win first, then slowest loss
+        score = np.where(outcome == Tablebase.WIN, 1000 - distance, distance - 1000)
+        score = np.where(has_move, score, np.iinfo(np.int32).min)
+        best = np.argmax(score, axis=1)
+        rows = np.arange(len(best))
+
+        playable = self.__valid.copy()
+        if move_counter > 0:
+            playable &= self.__winners == NO_WINNER
+
+        stalemate = playable & ~has_move.any(axis=1)
+        solved = playable & ~stalemate
+
+        self.__outcome[move_counter] = np.where(
+            solved,
+            outcome[rows, best],
+            np.where(stalemate, Tablebase.LOSS, Tablebase.UNKNOWN),
+        )
+        self.__distance[move_counter] = np.where(solved, distance[rows, best], 0)
+        self.__best_move[move_counter] = np.where(
+            solved, self.__moves[hounds_to_move][rows, best], Tablebase.NO_MOVE
+        )
+
+
+def build_tablebase(path: str = Tablebase.TABLEBASE_PATH):
+    start = time.perf_counter()
+
+    builder = TablebaseBuilder().build()
+    builder.write(path)
+
+    elapsed = time.perf_counter() - start
+    logging.info(
+        "Tablebase with %d states written to %s in %.2fs",
+        Tablebase.STATE_COUNT,
+        path,
+        elapsed,
+    )
+
+    return builder
@@ -0,0 +1,79 @@
+import mmap
+from typing import BinaryIO, NamedTuple
+
+from engine import BitBoard, Tablebase
+from engine.BitBoard import BitState
+
+
+class TablebaseEntry(NamedTuple):
+    outcome: int
+    """`Tablebase.WIN` or `Tablebase.LOSS` for the side to move"""
+
+    distance: int
+    """Number of plies until the match ends with perfect play"""
+
+    move: tuple[int, int] | None
+    """Best `(from_index, to_index)` move for the side to move"""
+
+
+class TablebaseReader:
+    """Read-only view of a tablebase file.
+
+    The file is memory mapped rather than loaded, so opening it is instant and
+    every process reading the same file shares its physical pages. Lookups
+    rank the state and unpack a single record.
+    """
+
+    __file: BinaryIO
+    __mmap: mmap.mmap | None = None
+
+    def __init__(self, path: str = Tablebase.TABLEBASE_PATH):
+        self.__file = open(path, "rb")
+
+        try:
+            self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__check_header()
+        except (ValueError, OSError):
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def lookup(self, state: BitState):
+        outcome, distance, move = Tablebase.RECORD.unpack_from(
+            self.__mmap,
+            Tablebase.HEADER.size + Tablebase.rank(state) * Tablebase.RECORD.size,
+        )
+
+        if outcome == Tablebase.UNKNOWN:
+            return None
+
+        return TablebaseEntry(outcome, distance, Tablebase.decode_move(move))
+
+    def close(self):
+        if self.__mmap:
+            self.__mmap.close()
+
+        self.__file.close()
+
+    def __check_header(self):
+        if len(self.__mmap) < Tablebase.HEADER.size:
+            raise ValueError("Tablebase file is truncated")
+
+        magic, version, max_moves, state_count = Tablebase.HEADER.unpack_from(
+            self.__mmap
+        )
+
+        if magic != Tablebase.MAGIC or version != Tablebase.VERSION:
+            raise ValueError("Unsupported tablebase format, rebuild the tablebase")
+
+        if max_moves != BitBoard.MAX_MOVES or state_count != Tablebase.STATE_COUNT:
+            raise ValueError("Tablebase was built for other rules, rebuild it")
+
+        expected_size = Tablebase.HEADER.size + state_count * Tablebase.RECORD.size
+        if len(self.__mmap) != expected_size:
+            raise ValueError("Tablebase file is truncated")
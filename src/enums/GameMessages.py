@@ -11,3 +11,7 @@ class GameMessages(Enum):
     YOU_WIN = "Voce venceu!"
     YOU_LOSE = "Voce perdeu :("
     ABANDONED = "O oponente abandonou a partida!"
+    HINT_WIN = "Dica: com a jogada destacada você vence!"
+    HINT_LOSE = "Dica: a jogada destacada adia ao máximo a derrota."
+    NO_HINT = "Nenhuma dica disponível."
+    MOVE_FAILED = "Falha ao enviar a jogada, a partida não pode continuar."
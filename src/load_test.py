@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import logging
+from dog.load_test import run_load_test
+
+parser = argparse.ArgumentParser(
+    description="Play many concurrent matches through the Dog protocol.",
+    epilog="Without --url a local Dog server is started in process.",
+)
+parser.add_argument("--clients", type=int, default=200, help="number of clients")
+parser.add_argument("--url", help="Dog server to load, e.g. http://127.0.0.1:8000/")
+parser.add_argument(
+    "--timeout", type=float, default=120.0, help="seconds to wait for the matches"
+)
+parser.add_argument(
+    "--move-delay", type=float, default=0.0, help="average bot thinking time"
+)
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+logging.info("Running load test 🏋️")
+
+summary = run_load_test(
+    args.clients, args.url, args.timeout, move_delay=args.move_delay
+)
+print(json.dumps(summary, indent=2))
@@ -1,9 +1,45 @@
 #!/usr/bin/env python3
 
+import time
+
+# Taken before the other imports, so they are part of the startup timings
+start = time.perf_counter()
+
+import argparse
 import logging
+import sys
 from views.PlayerInterface import PlayerInterface
+from views.StartupProfiler import StartupProfiler
+
+profiler = StartupProfiler(start)
+profiler.mark("imports")
+
+parser = argparse.ArgumentParser(description="Play Hare and Hounds.")
+parser.add_argument(
+    "--profile-startup",
+    action="store_true",
+    help="log the duration of every startup phase",
+)
+parser.add_argument(
+    "--startup-budget",
+    type=float,
+    metavar="MS",
+    help="quit once the board is painted, failing if it took longer than MS ms",
+)
+args = parser.parse_args()
 
 logging.basicConfig(level=logging.INFO)
 logging.info("Running project 🚀")
 
-PlayerInterface().start()
+profiler.enabled = args.profile_startup or args.startup_budget is not None
+PlayerInterface(profiler).start(first_frame_only=args.startup_budget is not None)
+
+if args.startup_budget is not None:
+    first_frame_ms = profiler.time_to_first_frame * 1000
+    if first_frame_ms > args.startup_budget:
+        logging.error(
+            "First frame after %.1f ms, over the %.1f ms budget",
+            first_frame_ms,
+            args.startup_budget,
+        )
+        sys.exit(1)
@@ -0,0 +1,61 @@
+from enums.Animal import Animal
+
+
+class Move:
+    """A move as exchanged with the opponent.
+
+    Pieces are identified by node index, so decoding a move needs no board
+    geometry and works across window sizes and headless clients.
+    """
+
+    __from_index: int
+    __to_index: int
+    __number: int
+    __winner: Animal | None
+
+    def __init__(
+        self,
+        from_index: int,
+        to_index: int,
+        number: int,
+        winner: Animal | None = None,
+    ):
+        self.__from_index = from_index
+        self.__to_index = to_index
+        self.__number = number
+        self.__winner = winner
+
+    @property
+    def from_index(self) -> int:
+        return self.__from_index
+
+    @property
+    def to_index(self) -> int:
+        return self.__to_index
+
+    @property
+    def number(self) -> int:
+        """Move counter once this move is played"""
+        return self.__number
+
+    @property
+    def winner(self) -> Animal | None:
+        return self.__winner
+
+    @property
+    def match_status(self) -> str:
+        return "finished" if self.__winner else "next"
+
+    def to_dict(self):
+        return {
+            "move": [self.__from_index, self.__to_index, self.__number],
+            "winner": self.__winner.value if self.__winner else None,
+            "match_status": self.match_status,
+        }
+
+    @classmethod
+    def from_dict(cls, move: dict):
+        from_index, to_index, number = move["move"]
+        winner = Animal(move["winner"]) if move["winner"] else None
+
+        return cls(from_index, to_index, number, winner)
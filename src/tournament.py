@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+
+import argparse
+import logging
+from ai.Tournament import run_tournament
+
+parser = argparse.ArgumentParser(
+    description="Play Hare and Hounds games between two agents.",
+    epilog="Agents: random, alphabeta[:easy|medium|hard], mcts[:seconds], tablebase",
+)
+parser.add_argument("--hounds", default="alphabeta", help="agent playing the Hounds")
+parser.add_argument("--hare", default="random", help="agent playing the Hare")
+parser.add_argument("--games", type=int, default=100, help="number of games")
+parser.add_argument("--workers", type=int, help="worker processes, all CPUs by default")
+parser.add_argument(
+    "--output", default="tournament.jsonl", help="file results are streamed to"
+)
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+logging.info("Running tournament 🏆")
+
+run_tournament(args.hounds, args.hare, args.games, args.output, args.workers)
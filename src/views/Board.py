@@ -1,18 +1,20 @@
 import math
-from PIL import ImageTk, Image
+import os
 import tkinter as tk
 from enums.Animal import Animal
 from enums.MatchStatus import MatchStatus
+from engine.GameEngine import GameEngine
+from models.Move import Move
 from models.Player import Player
 from models.Position import Position
 from models.Piece import Piece
+from views.ImageCache import ImageCache
+from views.StartupProfiler import StartupProfiler
 
 
 class Board:
-    __positions: list[Position]
-    __pieces: tuple[Piece, list[Piece]]  # Hare, Hounds
+    __engine: GameEngine
     __match_status = MatchStatus.NOT_STARTED
-    __move_counter = 0
 
     # Fake players initialization
     __local_player = Player("Hare", "Hare player", Animal.HARE)
@@ -26,24 +28,62 @@ class Board:
     __gap_px = 200
     """Gap in pixels between positions"""
 
+    __origin: tuple[float, float]
+    """Pixel coordinates of the top left lattice position"""
+
+    __theme = {
+        "background": "#CCCCCC",
+        "edge": "white",
+        "edge_width": 8,
+        "position": "black",
+    }
+    """Colors and widths of the static board layer"""
+
+    __image_cache: ImageCache
+
+    __background_image: tk.PhotoImage
+
     __image_radius = 64
     __image_size = __image_radius * 2
     """Size of the image in px"""
 
-    __hare_image: ImageTk.PhotoImage
-    __hound_image: ImageTk.PhotoImage
-
-    def __init__(self, tk_root: tk.Tk, canvas: tk.Canvas):
+    __hare_image: tk.PhotoImage
+    __hound_image: tk.PhotoImage
+
+    __hare_item: int
+    __hound_items: list[int]
+    __piece_items: dict[Piece, int]
+    """Canvas item of the sprite of every piece, kept across matches"""
+    __item_pieces: dict[int, Piece]
+    __item_coords: dict[int, tuple[float, float]]
+    """Last pixel coordinates each sprite was moved to"""
+
+    def __init__(
+        self,
+        tk_root: tk.Tk,
+        canvas: tk.Canvas,
+        profiler: StartupProfiler | None = None,
+    ):
         self.__tk = tk_root
         self.__canvas = canvas
+        self.__engine = GameEngine()
+        self.__piece_items = {}
+        self.__item_pieces = {}
+        self.__item_coords = {}
+        self.__image_cache = ImageCache()
 
         self.__init_images()
-        self.__init_positions()
-        self.__init_pieces()
+        if profiler:
+            profiler.mark("image load")
+        self.__init_origin()
+
+    @property
+    def engine(self):
+        return self.__engine
 
     @property
     def positions(self):
-        return self.__positions
+        return self.__engine.positions
 
     @property
     def image_radius(self):
@@ -55,7 +95,7 @@ class Board:
 
     @property
     def move_counter(self):
-        return self.__move_counter
+        return self.__engine.move_counter
 
     def is_match_in_progress(self):
         return (
@@ -67,194 +107,214 @@ class Board:
         return self.__match_status == MatchStatus.FINISHED
 
     def draw_board(self):
-        self.__draw_edges()
-        self.__draw_positions()
+        self.__draw_background()
         self.__draw_pieces()
+        self.__bind_pieces()
+
+    def get_coords(self, position: Position):
+        """Pixel coordinates of the center of `position` on the canvas."""
+        origin_x, origin_y = self.__origin
+        return (
+            origin_x + self.__gap_px * position.x,
+            origin_y + self.__gap_px * position.y,
+        )
 
     def __init_images(self):
         """Initialize images once to avoid reloading every time."""
-        self.__hare_image = ImageTk.PhotoImage(
-            Image.open("src/images/hare.png").resize(
-                (self.__image_size, self.__image_size)
-            )
+        self.__hare_image = tk.PhotoImage(
+            file=self.__image_cache.sprite("src/images/hare.png", self.__image_size)
         )
-        self.__hound_image = ImageTk.PhotoImage(
-            Image.open("src/images/hound.png").resize(
-                (self.__image_size, self.__image_size)
-            )
+        self.__hound_image = tk.PhotoImage(
+            file=self.__image_cache.sprite("src/images/hound.png", self.__image_size)
         )
 
-    def __draw_positions(self):
-        for position in self.__positions:
-            self.__canvas.create_oval(
-                position.x - self.__position_radius,
-                position.y - self.__position_radius,
-                position.x + self.__position_radius,
-                position.y + self.__position_radius,
-                fill="black",
-                outline="",
-            )
+    def __init_origin(self):
+        # Make sure to update TK before getting width and height
+        self.__tk.update()
 
-    def __draw_edges(self):
-        visited = set()
+        window_width = self.__canvas.winfo_width()
+        window_height = self.__canvas.winfo_height()
 
-        for position in self.__positions:
+        # Center the lattice on the canvas
+        self.__origin = (
+            window_width / 2 - self.__gap_px * (GameEngine.COLS - 1) / 2,
+            window_height / 2 - self.__gap_px * (GameEngine.ROWS - 1) / 2,
+        )
+
+    def __draw_background(self):
+        """Draw edges and positions as a single image.
+
+        The image is rendered once per canvas size and theme and cached on
+        disk between runs.
+        """
+        width = self.__canvas.winfo_width()
+        height = self.__canvas.winfo_height()
+        path = self.__background_path(width, height)
+
+        if not os.path.exists(path):
+            self.__render_background(path, width, height)
+
+        self.__background_image = tk.PhotoImage(file=path)
+        self.__canvas.create_image(
+            0, 0, anchor=tk.NW, image=self.__background_image, tags=["board"]
+        )
+
+    def __background_path(self, width: int, height: int):
+        return self.__image_cache.path(
+            f"board-{width}x{height}",
+            self.__gap_px,
+            self.__position_radius,
+            sorted(self.__theme.items()),
+        )
+
+    def __render_background(self, path: str, width: int, height: int):
+        from PIL import Image, ImageDraw
+
+        # Render at twice the size and downscale to smooth lines and circles
+        scale = 2
+        image = Image.new(
+            "RGB", (width * scale, height * scale), self.__theme["background"]
+        )
+        draw = ImageDraw.Draw(image)
+
+        def scaled(position: Position):
+            x, y = self.get_coords(position)
+            return x * scale, y * scale
+
+        visited = set()
+        for position in self.positions:
             visited.add(position)
             for adjacent_position in position.adjacent_positions:
                 if adjacent_position not in visited:
-                    self.__canvas.create_line(
-                        position.x,
-                        position.y,
-                        adjacent_position.x,
-                        adjacent_position.y,
-                        width=8,
-                        fill="white",
+                    draw.line(
+                        [scaled(position), scaled(adjacent_position)],
+                        fill=self.__theme["edge"],
+                        width=self.__theme["edge_width"] * scale,
                     )
 
+        radius = self.__position_radius * scale
+        for position in self.positions:
+            x, y = scaled(position)
+            draw.ellipse(
+                [x - radius, y - radius, x + radius, y + radius],
+                fill=self.__theme["position"],
+            )
+
+        self.__image_cache.store(image.resize((width, height), Image.LANCZOS), path)
+
     def __draw_pieces(self):
-        for position in self.__positions:
-            piece = position.piece
-            if piece:
-                image = (
-                    self.__hare_image
-                    if piece.animal == Animal.HARE
-                    else self.__hound_image
-                )
-                self.__canvas.create_image(
-                    position.x,
-                    position.y,
-                    anchor=tk.CENTER,
-                    image=image,
-                    tags=["draggable", "piece"],
-                )
-
-    def __init_positions(self):
-        # Make sure to update TK before getting width and height
-        self.__tk.update()
+        """Create the sprites once, they are only moved afterwards."""
+        self.__hare_item = self.__create_piece_item(self.__hare_image)
+        self.__hound_items = [
+            self.__create_piece_item(self.__hound_image) for _ in self.__engine.hounds
+        ]
+
+    def __create_piece_item(self, image: tk.PhotoImage):
+        return self.__canvas.create_image(
+            0, 0, anchor=tk.CENTER, image=image, tags=["draggable", "piece"]
+        )
 
-        rows, cols = 3, 5
+    def __bind_pieces(self):
+        """Attach the sprites to the current pieces and move them in place."""
+        items = [self.__hare_item, *self.__hound_items]
+        pieces = [self.__engine.hare, *self.__engine.hounds]
 
-        # A temporary 3x5 matrix used to initialize all the positions
-        positions_matrix = [[] for _ in range(rows)]
+        self.__piece_items = dict(zip(pieces, items))
+        self.__item_pieces = dict(zip(items, pieces))
 
-        self.__populate_positions_matrix(positions_matrix, rows, cols)
-        self.__set_adjacent_positions(positions_matrix)
+        for piece in pieces:
+            self.render_piece(piece)
 
-        # Flatten the matrix
-        positions = [item for sublist in positions_matrix for item in sublist]
+    def get_item_piece(self, item: int):
+        """Piece drawn by the canvas `item`, `None` if it is not a sprite."""
+        return self.__item_pieces.get(item)
 
-        # Filter out None values
-        self.__positions = list(filter(None, positions))
+    def render_piece(self, piece: Piece):
+        """Move the sprite of `piece` to its position, if not already there."""
+        self.move_piece_sprite(piece, *self.get_coords(piece.position))
 
-        # Sort positions by x coordinate to initialize pieces on the sides of the board
-        self.__positions.sort(key=lambda position: position.x)
+    def move_piece_sprite(self, piece: Piece, x: float, y: float):
+        item = self.__piece_items[piece]
 
-    def __populate_positions_matrix(self, matrix: list[list], rows=3, cols=5):
-        window_width = self.__canvas.winfo_width()
-        window_height = self.__canvas.winfo_height()
+        if self.__item_coords.get(item) == (x, y):
+            return
 
-        mid_x, mid_y = window_width / 2, window_height / 2
-
-        for i in range(rows):
-            for j in range(cols):
-                # If the coord is one of the 4 board corners, append `None`
-                if (i == 0 or i == rows - 1) and (j == 0 or j == cols - 1):
-                    matrix[i].append(None)
-
-                else:
-                    x = mid_x + self.__gap_px * (j - 2)
-                    y = mid_y + self.__gap_px * (i - 1)
-                    matrix[i].append(Position(x, y))
-
-    def __set_adjacent_positions(self, matrix: list[list[Position]]):
-        rows = len(matrix)
-        cols = len(matrix[0])
-
-        # Direction vectors starting from the 4 (up, down, left, right) main
-        # directions and then the 4 diagonal directions
-        dx = [0, 0, -1, 1, 1, 1, -1, -1]
-        dy = [1, -1, 0, 0, 1, -1, 1, -1]
-
-        for i in range(rows):
-            for j in range(cols):
-                position = matrix[i][j]
-
-                if not position:
-                    continue
-
-                # Add adjacent positions in all directions if row + col is odd,
-                # else only in the 4 main directions (up, down, left, right).
-                direction_range = 8 if i + j % 2 == 1 else 4
-
-                for k in range(direction_range):
-                    new_x = i + dx[k]
-                    new_y = j + dy[k]
-
-                    # Check if x and y are within matrix bounds
-                    if (
-                        new_x >= 0
-                        and new_x < rows
-                        and new_y >= 0
-                        and new_y < cols
-                        and matrix[new_x][new_y]
-                    ):
-                        position.add_adjacent_position(matrix[new_x][new_y])
-
-    def __init_pieces(self):
-        # Get first position to init Hounds (leftmost position)
-        first_position = self.__positions[0]
-
-        hounds = []
-
-        # For loop to init Hounds
-        for _ in range(3):
-            # If the first position is empty, add a Hound to it
-            if not first_position.piece:
-                hounds.append(Piece(Animal.HOUND, first_position))
-                continue
-
-            # Iterate over the adjacent positions of the first position
-            for adjacent_position in first_position.adjacent_positions:
-                # If the adjacent position is not in the same row as the first
-                # and if it is empty
-                if (
-                    adjacent_position.y != first_position.y
-                    and not adjacent_position.piece
-                ):
-                    # Add a Hound to the adjacent position
-                    hounds.append(Piece(Animal.HOUND, adjacent_position))
-                    break
-
-        # Get last position to init Hare (rightmost position)
-        last_position = self.__positions[-1]
-
-        self.__pieces = (Piece(Animal.HARE, last_position), hounds)
+        self.__canvas.coords(item, x, y)
+        self.__item_coords[item] = (x, y)
 
     def get_position(self, x: int, y: int):
-        for position in self.__positions:
-            distance = math.hypot(x - position.x, y - position.y)
-            if distance <= self.__position_radius:
-                return position
+        origin_x, origin_y = self.__origin
+
+        # Snap to the closest lattice point, then check the point is inside
+        # its circle
+        position = self.__engine.get_position(
+            round((x - origin_x) / self.__gap_px),
+            round((y - origin_y) / self.__gap_px),
+        )
+
+        if not position:
+            return None
+
+        position_x, position_y = self.get_coords(position)
+        distance = math.hypot(x - position_x, y - position_y)
+        if distance <= self.__position_radius:
+            return position
+
+        return None
 
     def is_valid_move(self, from_position: Position, to_position: Position | None):
-        if not to_position:
-            return False
+        return self.__engine.is_valid_move(from_position, to_position)
 
-        piece = from_position.piece
-        occupied = to_position.piece
+    def legal_targets(self, from_position: Position):
+        return self.__engine.legal_targets(from_position)
 
-        if (
-            not piece
-            or occupied
-            or from_position == to_position
-            or to_position not in from_position.adjacent_positions
-        ):
-            return False
+    def get_move_positions(self, move: tuple[int, int]):
+        """Positions of a `(from_index, to_index)` move."""
+        from_index, to_index = move
+        return self.positions[from_index], self.positions[to_index]
+
+    def draw_hint(self, from_position: Position, to_position: Position):
+        self.clear_hint()
+
+        for position in (from_position, to_position):
+            x, y = self.get_coords(position)
+            self.__canvas.create_oval(
+                x - self.__image_radius,
+                y - self.__image_radius,
+                x + self.__image_radius,
+                y + self.__image_radius,
+                outline="gold",
+                width=6,
+                tags=["hint"],
+            )
+
+        # Keep pieces on top so they can still be dragged
+        self.__canvas.tag_raise("piece", "hint")
+
+    def clear_hint(self):
+        self.__canvas.delete("hint")
+
+    def draw_targets(self, positions: list[Position]):
+        """Highlight the positions the dragged piece may be dropped on."""
+        self.clear_targets()
+
+        for position in positions:
+            x, y = self.get_coords(position)
+            self.__canvas.create_oval(
+                x - self.__position_radius,
+                y - self.__position_radius,
+                x + self.__position_radius,
+                y + self.__position_radius,
+                outline="green",
+                width=6,
+                tags=["target"],
+            )
 
-        if piece.animal == Animal.HOUND and to_position.x < from_position.x:
-            return False
+        # Keep pieces on top so they can still be dragged
+        self.__canvas.tag_raise("piece", "target")
 
-        return True
+    def clear_targets(self):
+        self.__canvas.delete("target")
 
     def is_local_player_piece(self, piece: Piece):
         return piece.animal == self.__local_player.animal
@@ -266,19 +326,24 @@ class Board:
         return self.__local_player.is_winner
 
     def move_piece(self, from_position: Position, to_position: Position):
+        self.clear_hint()
+
         piece = from_position.piece
-        piece.position = to_position
+        from_index = self.__engine.get_position_index(from_position)
+        to_index = self.__engine.get_position_index(to_position)
+        animal_winner = self.__engine.move(from_position, to_position)
+        self.render_piece(piece)
 
-        move_to_send = {}
+        move_to_send = None
 
         # Build move to send only if is local player turn and he made a move
         if self.match_status == MatchStatus.LOCAL_PLAYER_TURN:
-            move_to_send["to_pos"] = [to_position.x, to_position.y]
-            move_to_send["from_pos"] = [from_position.x, from_position.y]
+            if animal_winner:
+                self.set_winner(animal_winner.value)
 
-            animal_winner = self.evaluate_match_winner()
-            move_to_send["winner"] = animal_winner.value if animal_winner else None
-            move_to_send["match_status"] = "finished" if animal_winner else "next"
+            move_to_send = Move(
+                from_index, to_index, self.__engine.move_counter, animal_winner
+            )
 
         self.toggle_players_turn()
 
@@ -330,9 +395,6 @@ class Board:
         self.__local_player.toggle_turn()
         self.__remote_player.toggle_turn()
 
-    def increase_move_counter(self):
-        self.__move_counter += 1
-
     def reset(self):
         match_status = self.__match_status
         # Only reset board if match was finished or abandoned
@@ -342,17 +404,14 @@ class Board:
         ):
             return
 
-        self.__move_counter = 0
-        self.__canvas.delete("piece")
+        self.clear_hint()
 
-        for position in self.__positions:
-            if position.piece:
-                position.piece = None
-
-        self.__init_pieces()
-        self.__draw_pieces()
+        self.__engine.reset()
+        self.__bind_pieces()
 
     def set_winner(self, animal: str):
+        self.__engine.set_winner(Animal(animal))
+
         if self.__local_player.animal.value == animal:
             self.__local_player.set_winner()
 
@@ -360,40 +419,3 @@ class Board:
             self.__remote_player.set_winner()
 
         self.__match_status = MatchStatus.FINISHED
-
-    def evaluate_hare_win(self, hare: Piece, hounds: list[Piece]):
-        hare_escaped = True
-
-        for hound in hounds:
-            # Check if there's at least one hound on the left of the hare
-            if hound.position.x < hare.position.x:
-                hare_escaped = False
-                break
-
-        if hare_escaped or self.move_counter >= 50:
-            return True
-
-        return False
-
-    def evaluate_hound_win(self, hare: Piece):
-        # If there's at least one empty adjacent position from the Hare, game continues
-        for adjacent_position in hare.position.adjacent_positions:
-            if not adjacent_position.piece:
-                return False
-
-        return True
-
-    def evaluate_match_winner(self):
-        animal_winner: Animal | None = None
-        hare, hounds = self.__pieces
-
-        if self.evaluate_hare_win(hare, hounds):
-            animal_winner = Animal.HARE
-
-        if self.evaluate_hound_win(hare):
-            animal_winner = Animal.HOUND
-
-        if animal_winner:
-            self.set_winner(animal_winner.value)
-
-        return animal_winner
@@ -0,0 +1,41 @@
+import hashlib
+import os
+
+
+class ImageCache:
+    """Pre-rendered images stored as PNG, which Tk loads natively.
+
+    Images are keyed by everything they are rendered from, so a cached file
+    is never stale. PIL is only imported on a cache miss, which keeps it out
+    of the usual startup.
+    """
+
+    __cache_dir: str
+
+    def __init__(self, cache_dir: str = "src/images/cache"):
+        self.__cache_dir = cache_dir
+
+    def path(self, name: str, *key):
+        """Path of the cached image `name` rendered from `key`."""
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:12]
+        return os.path.join(self.__cache_dir, f"{name}-{digest}.png")
+
+    def sprite(self, source_path: str, size: int):
+        """Path of `source_path` resized to `size` x `size` pixels."""
+        name = os.path.splitext(os.path.basename(source_path))[0]
+        path = self.path(f"{name}-{size}", os.stat(source_path).st_mtime_ns)
+
+        if not os.path.exists(path):
+            from PIL import Image
+
+            with Image.open(source_path) as image:
+                self.store(image.resize((size, size), Image.LANCZOS), path)
+
+        return path
+
+    def store(self, image, path: str):
+        """Save a PIL `image` to `path`, never leaving a partial file."""
+        os.makedirs(self.__cache_dir, exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        image.save(temporary_path, format="PNG")
+        os.replace(temporary_path, path)
@@ -1,5 +1,7 @@
 from tkinter import Tk, Menu
 
+from enums.Difficulty import Difficulty
+
 
 class Menubar(Menu):
     __tk: Tk
@@ -22,3 +24,21 @@ class Menubar(Menu):
             label="Iniciar partida",
             command=start_match_command,
         )
+
+    def build_hint_command(self, hint_command: callable):
+        self.__match_dropdown.add_command(label="Dica", command=hint_command)
+
+    def build_ai_dropdown(self, start_ai_match_command: callable):
+        ai_dropdown = Menu(self.__match_dropdown, tearoff=0)
+
+        self.__match_dropdown.add_cascade(
+            label="Jogar contra o computador", menu=ai_dropdown
+        )
+
+        for difficulty in Difficulty:
+            ai_dropdown.add_command(
+                label=difficulty.value,
+                command=lambda difficulty=difficulty: start_ai_match_command(
+                    difficulty
+                ),
+            )
@@ -1,15 +1,25 @@
+import logging
+import random
+import time
 import tkinter as tk
+from concurrent.futures import Future
 from tkinter import messagebox
 from tkinter import simpledialog
-from typing import Literal
 
+from ai.AiActor import AiActor
 from dog.dog_actor import DogActor
 from dog.start_status import StartStatus
 from dog.dog_interface import DogPlayerInterface
 
+from engine import Tablebase
+from engine.TablebaseReader import TablebaseReader
 from views.Board import Board
 from views.MenuBar import Menubar
-from models.Position import Position
+from views.StartupProfiler import StartupProfiler
+from views.UiDispatcher import UiDispatcher
+from models.Move import Move
+from models.Piece import Piece
+from enums.Difficulty import Difficulty
 from enums.GameMessages import GameMessages
 
 
@@ -21,36 +31,89 @@ class PlayerInterface(DogPlayerInterface):
 
     __board: Board
     __menubar: Menubar
+    __dispatcher: UiDispatcher
+    __profiler: StartupProfiler
 
     __game_info_frame: tk.Frame
     __game_messages: tk.Label
     __game_move_counter: tk.Label
 
-    __dragging_item: tuple[int, Position] | None = None
+    __dragging_piece: Piece | None = None
+    __drag_pointer: tuple[int, int] | None = None
+    """Latest pointer coordinates, rendered on the next frame"""
+    __drag_frame_pending = False
+    __drag_frame_ms = 16
+    """Delay between drag updates, about one frame"""
+    __drag_events = 0
+    __drag_frame_times: list[float] = []
+    __starting_match = False
 
     __dog_server_interface: DogActor
+    __opponent: DogActor | AiActor
+    """Actor the local moves are sent to"""
 
-    def __init__(self):
+    __player_name: str
+    __tablebase: TablebaseReader | None = None
+
+    def __init__(self, profiler: StartupProfiler | None = None):
         super().__init__()
+        self.__profiler = profiler or StartupProfiler()
 
         self.__init_window()
+        self.__profiler.mark("window creation")
         self.__init_board_canvas()
+        self.__profiler.mark("board construction")
         self.__init_game_info_frame()
+        self.__init_tablebase()
+        self.__profiler.mark("tablebase")
 
-        player_name = simpledialog.askstring(
-            title="Player identification", prompt="Qual o seu nome?"
-        )
         self.__dog_server_interface = DogActor()
-        message = self.__dog_server_interface.initialize(player_name, self)
-        messagebox.showinfo(message=message)
+        self.__opponent = self.__dog_server_interface
 
-    def start(self):
+    def start(self, first_frame_only=False):
         self.__board.draw_board()
+        # Paint the board before anything waits for the player or the server
+        self.__tk.update()
+        self.__profiler.mark_first_frame()
+
+        if first_frame_only:
+            self.__tk.destroy()
+            return
+
+        self.__tk.after_idle(self.__register)
         self.__tk.mainloop()
+        self.__dog_server_interface.stop()
+
+    def __register(self):
+        player_name = simpledialog.askstring(
+            title="Player identification", prompt="Qual o seu nome?"
+        )
+        self.__player_name = player_name
+
+        # Requests run in order, a match started meanwhile waits for the
+        # registration
+        start = time.perf_counter()
+        future = self.__dog_server_interface.initialize_async(player_name, self)
+
+        def registered(future):
+            self.__profiler.record("server registration", time.perf_counter() - start)
+            self.__dispatcher.call(self.__on_registered, future)
+
+        future.add_done_callback(registered)
+
+    def __on_registered(self, future: Future):
+        try:
+            message = future.result()
+        except Exception as error:
+            logging.exception("Registration on the Dog server failed")
+            messagebox.showerror(message=f"Falha ao conectar ao servidor: {error}")
+            return
+
+        messagebox.showinfo(message=message)
 
     def start_match_command(self):
-        # Do nothing if the game already started
-        if self.__board.is_match_in_progress():
+        # Do nothing if the game already started or is starting
+        if self.__board.is_match_in_progress() or self.__starting_match:
             return
 
         answer = messagebox.askyesno("START", "Deseja iniciar uma nova partida?")
@@ -59,14 +122,31 @@ class PlayerInterface(DogPlayerInterface):
         if not answer:
             return
 
-        # Start a new match with 2 players
-        start_status = self.__dog_server_interface.start_match(2)
+        # Start a new match with 2 players, without blocking the window
+        self.__starting_match = True
+        self.__dog_server_interface.accepting_starts = True
+        future = self.__dog_server_interface.start_match_async(2)
+        future.add_done_callback(
+            lambda future: self.__dispatcher.call(self.__on_match_started, future)
+        )
+
+    def __on_match_started(self, future: Future):
+        self.__starting_match = False
+
+        try:
+            start_status: StartStatus = future.result()
+        except Exception as error:
+            logging.exception("Starting a match failed")
+            messagebox.showerror(message=f"Falha ao iniciar a partida: {error}")
+            return
+
         code = start_status.get_code()
         message = start_status.get_message()
 
         if code == "0" or code == "1":
             messagebox.showinfo(message=message)
         else:
+            self.__opponent = self.__dog_server_interface
             self.setup_game()
             self.__board.start_match(start_status.get_players())
 
@@ -78,7 +158,63 @@ class PlayerInterface(DogPlayerInterface):
         else:
             self.show_game_info_message(GameMessages.WAITING_OPPONENT)
 
+    def hint_command(self):
+        # Hints are only available during the local player turn
+        if not self.__board.is_local_player_turn():
+            return
+
+        entry = None
+        if self.__tablebase:
+            entry = self.__tablebase.lookup(self.__board.engine.state)
+
+        if not entry or not entry.move:
+            self.show_game_info_message(GameMessages.NO_HINT)
+            return
+
+        self.__board.draw_hint(*self.__board.get_move_positions(entry.move))
+
+        if entry.outcome == Tablebase.WIN:
+            self.show_game_info_message(GameMessages.HINT_WIN)
+        else:
+            self.show_game_info_message(GameMessages.HINT_LOSE)
+
+    def start_ai_match_command(self, difficulty: Difficulty):
+        # Do nothing if the game already started or is starting
+        if self.__board.is_match_in_progress() or self.__starting_match:
+            return
+
+        # Matches started by online players meanwhile are declined
+        self.__dog_server_interface.accepting_starts = False
+
+        ai_actor = AiActor(difficulty, self.__board)
+        ai_actor.initialize(self.__player_name, self)
+
+        # Randomly choose who plays the Hounds and starts
+        start_status = ai_actor.start_match(2, random.choice(["1", "2"]))
+
+        self.__opponent = ai_actor
+        self.setup_game()
+        self.__board.start_match(start_status.get_players())
+
+        if self.__board.is_local_player_turn():
+            self.show_game_info_message(GameMessages.START_DRAG)
+
+        else:
+            self.show_game_info_message(GameMessages.WAITING_OPPONENT)
+
+        ai_actor.start()
+
     def receive_start(self, start_status: StartStatus):
+        # Called from the polling thread, handle it on the Tk thread
+        self.__dispatcher.call(self.__receive_start, start_status)
+
+    def __receive_start(self, start_status: StartStatus):
+        # The start may have been polled just before a computer match began
+        if self.__board.is_match_in_progress():
+            self.__dog_server_interface.decline_match()
+            return
+
+        self.__opponent = self.__dog_server_interface
         self.setup_game()
         self.__board.start_match(start_status.get_players())
 
@@ -102,47 +238,72 @@ class PlayerInterface(DogPlayerInterface):
         if not item or len(item) == 0:
             return
 
-        coord = self.__canvas.coords(item[0])
-        from_position = self.__board.get_position(coord[0], coord[1])
+        piece = self.__board.get_item_piece(item[0])
 
-        if not from_position or not from_position.piece:
+        if not piece:
             return
 
         # Check if chosen piece belongs to local player
-        if self.__board.is_local_player_piece(from_position.piece):
-            self.__dragging_item = (item[0], from_position)
+        if self.__board.is_local_player_piece(piece):
+            self.__dragging_piece = piece
+            self.__drag_events = 0
+            self.__drag_frame_times = []
+            self.__board.draw_targets(self.__board.legal_targets(piece.position))
 
         else:
             self.show_game_info_message(GameMessages.INVALID_PIECE)
 
     def drag(self, event: tk.Event):
-        if self.__dragging_item:
-            self.update_piece_screen_position(event.x, event.y)
+        if not self.__dragging_piece:
+            return
+
+        # Motion events can come much faster than the screen refreshes, only
+        # the latest pointer position is rendered once per frame
+        self.__drag_events += 1
+        self.__drag_pointer = (event.x, event.y)
+
+        if not self.__drag_frame_pending:
+            self.__drag_frame_pending = True
+            self.__tk.after(self.__drag_frame_ms, self.__render_drag_frame)
+
+    def __render_drag_frame(self):
+        self.__drag_frame_pending = False
+
+        if not self.__dragging_piece:
+            return
+
+        start = time.perf_counter()
+        self.__board.move_piece_sprite(self.__dragging_piece, *self.__drag_pointer)
+        self.__canvas.update_idletasks()
+        self.__drag_frame_times.append(time.perf_counter() - start)
 
     def end_drag(self, event: tk.Event):
-        if not self.__dragging_item:
+        if not self.__dragging_piece:
             return
 
-        from_position = self.__dragging_item[1]
+        self.__board.clear_targets()
+        self.__log_drag_frames()
+
+        from_position = self.__dragging_piece.position
         to_position = self.__board.get_position(event.x, event.y)
         valid_move = self.__board.is_valid_move(from_position, to_position)
 
         if not to_position or not valid_move:
             self.show_game_info_message(GameMessages.INVALID_MOVE)
             # Return piece back to initial position
-            self.update_piece_screen_position(from_position.x, from_position.y)
+            self.__board.render_piece(self.__dragging_piece)
 
         else:
             move_to_send = self.__board.move_piece(from_position, to_position)
 
             self.update_move_counter()
-            self.update_piece_screen_position(to_position.x, to_position.y)
 
-            self.__dog_server_interface.send_move(move_to_send)
+            self.__opponent.send_move(move_to_send)
 
             game_message = GameMessages.WAITING_OPPONENT
 
             if self.__board.is_match_finished():
+                self.__dog_server_interface.accepting_starts = True
                 game_message = (
                     GameMessages.YOU_WIN
                     if self.__board.is_local_player_winner()
@@ -151,59 +312,62 @@ class PlayerInterface(DogPlayerInterface):
 
             self.show_game_info_message(game_message)
 
-        self.__dragging_item = None
+        self.__dragging_piece = None
 
-    def update_piece_screen_position(
-        self,
-        x: int,
-        y: int,
-        item_id: int | None = None,
-    ):
-        if not item_id and not self.__dragging_item:
+    def __log_drag_frames(self):
+        frame_times = self.__drag_frame_times
+        if not frame_times:
             return
 
-        self.__canvas.moveto(
-            item_id or self.__dragging_item[0],
-            x - self.__board.image_radius,
-            y - self.__board.image_radius,
+        logging.debug(
+            "Drag: %d motion events in %d frames, %.2fms average, %.2fms max",
+            self.__drag_events,
+            len(frame_times),
+            sum(frame_times) / len(frame_times) * 1000,
+            max(frame_times) * 1000,
         )
 
     def update_menubar(self):
         if self.__board.is_match_in_progress():
-            self.__menubar.match_dropdown.entryconfigure(
-                "Iniciar partida", state="disabled"
-            )
+            state = "disabled"
         else:
-            self.__menubar.match_dropdown.entryconfigure(
-                "Iniciar partida", state="normal"
-            )
+            state = "normal"
+
+        self.__menubar.match_dropdown.entryconfigure("Iniciar partida", state=state)
+        self.__menubar.match_dropdown.entryconfigure(
+            "Jogar contra o computador", state=state
+        )
 
     def update_move_counter(self):
-        self.__board.increase_move_counter()
         self.__game_move_counter["text"] = f"Movimentos: {self.__board.move_counter}"
 
-    def receive_move(self, move: dict):
-        to_pos_coord: list[int] = move["to_pos"]
-        from_pos_coord: list[int] = move["from_pos"]
-        match_status: Literal["next", "finished"] = move["match_status"]
-        animal_winner: str | None = move["winner"]
+    def receive_move(self, move: Move):
+        # Called from the polling and computer threads, handle it on the Tk thread
+        self.__dispatcher.call(self.__receive_move, move)
 
-        # It is safe to assume that positions exists since we check before sending the move
-        to_pos = self.__board.get_position(to_pos_coord[0], to_pos_coord[1])
-        from_pos = self.__board.get_position(from_pos_coord[0], from_pos_coord[1])
+    def __receive_move(self, move: Move):
+        # Well-formed moves may still be illegal, e.g. from a buggy opponent
+        if self.__board.is_local_player_turn() or not (
+            self.__board.engine.is_valid_next_move(
+                move.from_index, move.to_index, move.number
+            )
+        ):
+            logging.warning("Ignoring illegal move %s", move.to_dict())
+            return
 
-        # Find closest piece from "from_pos"
-        item = self.__canvas.find_closest(from_pos.x, from_pos.y)
+        from_pos, to_pos = self.__board.get_move_positions(
+            (move.from_index, move.to_index)
+        )
 
         self.__board.move_piece(from_pos, to_pos)
 
         self.update_move_counter()
-        self.update_piece_screen_position(to_pos.x, to_pos.y, item[0])
 
         game_message = GameMessages.YOUR_TURN
 
-        if match_status == "finished" and animal_winner:
-            self.__board.set_winner(animal_winner)
+        if move.match_status == "finished" and move.winner:
+            self.__board.set_winner(move.winner.value)
+            self.__dog_server_interface.accepting_starts = True
 
             if self.__board.is_local_player_winner():
                 game_message = GameMessages.YOU_WIN
@@ -214,10 +378,18 @@ class PlayerInterface(DogPlayerInterface):
         self.show_game_info_message(game_message)
 
     def receive_withdrawal_notification(self):
+        # Called from the polling thread, handle it on the Tk thread
+        self.__dispatcher.call(self.__receive_withdrawal_notification)
+
+    def __receive_withdrawal_notification(self):
         self.show_game_info_message(GameMessages.ABANDONED)
         self.__board.receive_withdrawal_notification()
         self.update_menubar()
 
+    def receive_move_failure(self, move: Move):
+        # Called from the network worker, handle it on the Tk thread
+        self.__dispatcher.call(self.show_game_info_message, GameMessages.MOVE_FAILED)
+
     def show_game_info_message(self, message: GameMessages):
         self.__game_messages["text"] = message.value
 
@@ -226,7 +398,11 @@ class PlayerInterface(DogPlayerInterface):
         if message == GameMessages.YOU_WIN:
             foreground_color = "green"
 
-        elif message == GameMessages.INVALID_MOVE or message == GameMessages.YOU_LOSE:
+        elif message in (
+            GameMessages.INVALID_MOVE,
+            GameMessages.YOU_LOSE,
+            GameMessages.MOVE_FAILED,
+        ):
             foreground_color = "red"
 
         self.__game_messages["foreground"] = foreground_color
@@ -237,9 +413,12 @@ class PlayerInterface(DogPlayerInterface):
         self.__tk.title("Hare and Hounds")
         self.__tk.geometry(f"{self.__window_width}x{self.__window_height}")
         self.__tk.wm_iconphoto(False, tk.PhotoImage(file="src/images/icon.png"))
+        self.__dispatcher = UiDispatcher(self.__tk)
 
         self.__menubar = Menubar(self.__tk)
         self.__menubar.build_match_dropdown(self.start_match_command)
+        self.__menubar.build_ai_dropdown(self.start_ai_match_command)
+        self.__menubar.build_hint_command(self.hint_command)
 
     def __init_board_canvas(self):
         self.__canvas = tk.Canvas(
@@ -252,7 +431,7 @@ class PlayerInterface(DogPlayerInterface):
 
         self.__canvas.pack(fill=tk.X, side=tk.TOP)
 
-        self.__board = Board(self.__tk, self.__canvas)
+        self.__board = Board(self.__tk, self.__canvas, self.__profiler)
 
     def __init_game_info_frame(self):
         self.__game_info_frame = tk.Frame(self.__tk, border=2, bg="#CCCCCC")
@@ -278,3 +457,9 @@ class PlayerInterface(DogPlayerInterface):
         self.__game_messages.grid(row=0, column=1, sticky="nsew", padx=(1, 0))
 
         self.__game_info_frame.pack(fill=tk.BOTH, expand=True)
+
+    def __init_tablebase(self):
+        try:
+            self.__tablebase = TablebaseReader()
+        except (OSError, ValueError) as error:
+            logging.warning("Tablebase unavailable, hints are disabled: %s", error)
@@ -0,0 +1,63 @@
+import logging
+import time
+
+
+class StartupProfiler:
+    """Durations of the client startup phases, from the launch of the process.
+
+    Phases running one after the other are marked when they end, phases
+    running in the background record their own duration. Durations are only
+    logged when profiling is enabled, as they are always recorded.
+    """
+
+    __start: float
+    __last: float
+    __phases: list[tuple[str, float]]
+    __time_to_first_frame: float | None = None
+    __enabled: bool
+
+    def __init__(self, start: float | None = None, enabled=False):
+        self.__start = time.perf_counter() if start is None else start
+        self.__last = self.__start
+        self.__phases = []
+        self.__enabled = enabled
+
+    @property
+    def phases(self):
+        return list(self.__phases)
+
+    @property
+    def time_to_first_frame(self):
+        """Seconds from the launch until the board was painted."""
+        return self.__time_to_first_frame
+
+    @property
+    def enabled(self):
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool):
+        self.__enabled = enabled
+
+    def mark(self, phase: str):
+        """End `phase`, which started when the previous phase ended."""
+        now = time.perf_counter()
+        self.record(phase, now - self.__last)
+        self.__last = now
+
+    def mark_first_frame(self):
+        self.mark("first frame")
+        self.__time_to_first_frame = self.__last - self.__start
+
+        if self.__enabled:
+            logging.info(
+                "Startup: first frame after %.1f ms",
+                self.__time_to_first_frame * 1000,
+            )
+
+    def record(self, phase: str, seconds: float):
+        """Thread-safe, record that `phase` took `seconds`."""
+        self.__phases.append((phase, seconds))
+
+        if self.__enabled:
+            logging.info("Startup: %s took %.1f ms", phase, seconds * 1000)
@@ -0,0 +1,40 @@
+import logging
+import queue
+import tkinter as tk
+
+
+class UiDispatcher:
+    """Runs callbacks coming from other threads on the Tk main loop.
+
+    Tk widgets must only be touched from the thread running the main loop, so
+    other threads enqueue callbacks, which are drained with `after`.
+    """
+
+    __tk: tk.Tk
+    __queue: queue.SimpleQueue
+    __interval_ms = 16
+    """Delay between queue drains, about one frame"""
+
+    def __init__(self, tk_root: tk.Tk):
+        self.__tk = tk_root
+        self.__queue = queue.SimpleQueue()
+        self.__tk.after(self.__interval_ms, self.__drain)
+
+    def call(self, function: callable, *args):
+        """Thread-safe, schedule `function(*args)` on the Tk main loop."""
+        self.__queue.put((function, args))
+
+    def __drain(self):
+        while True:
+            try:
+                function, args = self.__queue.get_nowait()
+            except queue.Empty:
+                break
+
+            # A failing callback must not stop the callbacks queued after it
+            try:
+                function(*args)
+            except Exception:
+                logging.exception("UI callback %r failed", function)
+
+        self.__tk.after(self.__interval_ms, self.__drain)
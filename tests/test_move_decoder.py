@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from dog.move_decoder import MoveDecodeError, decode_move, decode_response
+
+
+def polled_move(**fields):
+    move = {
+        "move": [3, 4, 12],
+        "winner": None,
+        "match_status": "next",
+        "player": "152438867993",
+        "order": "12",
+    }
+    move.update(fields)
+    return move
+
+
+@pytest.mark.parametrize("encode", [repr, json.dumps], ids=["literal", "json"])
+def test_decodes_move(encode):
+    move = polled_move()
+
+    assert decode_move(encode(move)) == move
+
+
+def test_no_move_yet():
+    assert decode_move("{}") == {}
+
+
+@pytest.mark.parametrize("player", ["TrueNone", "None", "False", "null"])
+def test_constants_inside_strings_are_kept(player):
+    move = polled_move(player=player)
+
+    assert decode_move(repr(move)) == move
+
+
+def test_strings_with_quotes_fall_back_to_literal_eval():
+    move = polled_move(player="it's")
+
+    assert decode_move(repr(move)) == move
+
+
+def test_finished_move_with_winner():
+    move = polled_move(match_status="finished", winner="Hare")
+
+    assert decode_move(repr(move)) == move
+
+
+def test_withdrawal_carries_no_move():
+    move = {"match_status": "interrupted", "player": "1", "order": "3"}
+
+    assert decode_move(repr(move)) == move
+
+
+@pytest.mark.parametrize("order", ["12", 12, 0])
+def test_accepts_decimal_or_integer_order(order):
+    move = polled_move(order=order)
+
+    assert decode_move(repr(move)) == move
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"order": "12a"},
+        {"order": -1},
+        {"order": True},
+        {"order": 12.0},
+        {"player": 152438867993},
+        {"move": [3, 4, True]},
+        {"move": [3, 4]},
+        {"move": [3, 11, 12]},
+        {"move": [3, 4, 0]},
+        {"match_status": "paused"},
+        {"winner": "Hare"},
+        {"winner": "Fox", "match_status": "finished"},
+        {"winner": None, "match_status": "finished"},
+    ],
+)
+def test_rejects_invalid_moves(fields):
+    with pytest.raises(MoveDecodeError):
+        decode_move(repr(polled_move(**fields)))
+
+
+@pytest.mark.parametrize("text", [None, "[1, 2]", "{'move': ", "__import__('os')"])
+def test_rejects_malformed_literals(text):
+    with pytest.raises(MoveDecodeError):
+        decode_move(text)
+
+
+@pytest.mark.parametrize("body", ["<html>", "[1, 2]", '"move"'])
+def test_rejects_malformed_responses(body):
+    with pytest.raises(MoveDecodeError):
+        decode_response(body)
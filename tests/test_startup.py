@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+STARTUP_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 1500))
+"""Longest accepted time from the launch to the first painted board"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.skipif(
+    sys.platform != "win32" and not os.environ.get("DISPLAY"),
+    reason="needs a display, e.g. run under xvfb-run",
+)
+def test_time_to_first_frame_within_budget():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "src/main.py",
+            "--startup-budget",
+            str(STARTUP_BUDGET_MS),
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr